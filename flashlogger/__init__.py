@@ -1,10 +1,79 @@
-from .color_scheme import *
-from .error import *
-from .log_channel_abc import *
-from .log_channel_file import *
-from .log_channel_console import *
-from .__init__ import *
-from .log_levels import *
-from .flash_logger import *
+import importlib
+
+# Public names -> submodule defining them. Submodules are only imported when one of their names is first accessed.
+_LAZY_IMPORTS = {
+    # color_scheme
+    "ColorScheme": ".color_scheme",
+    "Field": ".color_scheme",
+    # colorama, re-exported through color_scheme which imports it
+    "Back": ".color_scheme",
+    "Fore": ".color_scheme",
+    "Style": ".color_scheme",
+    # error
+    "fatal": ".error",
+    "critical": ".error",
+    "error": ".error",
+    # log_channel_abc
+    "LevelSpec": ".log_channel_abc",
+    "LogChannelABC": ".log_channel_abc",
+    "LogField": ".log_channel_abc",
+    "OutputFormat": ".log_channel_abc",
+    "use_orjson": ".log_channel_abc",
+    # log_channel_file
+    "FileLogChannel": ".log_channel_file",
+    "FileLogFormatter": ".log_channel_file",
+    # log_channel_console
+    "ConsoleFormatter": ".log_channel_console",
+    "DEFAULT_FORMAT": ".log_channel_console",
+    "LogChannelConsole": ".log_channel_console",
+    # log_levels
+    "LogLevel": ".log_levels",
+    "get_user_config_dir": ".log_levels",
+    # flash_logger
+    "FlashLogger": ".flash_logger",
+    "get_logger": ".flash_logger",
+    "log": ".flash_logger",
+    "log_command": ".flash_logger",
+    "log_critical": ".flash_logger",
+    "log_custom0": ".flash_logger",
+    "log_custom1": ".flash_logger",
+    "log_custom2": ".flash_logger",
+    "log_custom3": ".flash_logger",
+    "log_custom4": ".flash_logger",
+    "log_custom5": ".flash_logger",
+    "log_custom6": ".flash_logger",
+    "log_custom7": ".flash_logger",
+    "log_custom8": ".flash_logger",
+    "log_custom9": ".flash_logger",
+    "log_debug": ".flash_logger",
+    "log_error": ".flash_logger",
+    "log_fatal": ".flash_logger",
+    "log_header": ".flash_logger",
+    "log_info": ".flash_logger",
+    "log_progress_output": ".flash_logger",
+    "log_warning": ".flash_logger",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """
+    Import the public name from its submodule on first access (PEP 562).
+    :param name: the attribute name
+    :return: the attribute
+    :raises AttributeError: the name is not part of the public API
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    attr = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "2.5.0"
@@ -26,7 +26,9 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import sys
 from enum import auto
+from functools import lru_cache
 from pathlib import Path
 
 from colorama import init as colorama_init, Fore, Back, Style
@@ -34,7 +36,126 @@ from fundamentals.extended_enum import ExtendedEnum
 
 from flashlogger.log_levels import LogLevel
 
-colorama_init()
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        """
+        Serialize a color scheme with orjson.
+        :param obj: the color scheme configuration
+        :return: the JSON document, indented by 2 spaces, as UTF-8 bytes
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional, fall back to the standard library
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """
+        Serialize a color scheme with the standard library, in the same layout as orjson.
+        :param obj: the color scheme configuration
+        :return: the JSON document, indented by 2 spaces, as UTF-8 bytes
+        """
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+_colorama_initialized = False
+
+
+def _colorama_needed() -> bool:
+    """
+    Check whether colorama has to wrap the standard streams.
+
+    POSIX terminals understand ANSI codes natively, colorama would leave their streams unwrapped anyway.
+    Windows consoles need the conversion and redirected output needs the codes stripped.
+    :return: True if colorama has to be initialized
+    """
+    if sys.platform == "win32":
+        return True
+    try:
+        return not all(stream is not None and stream.isatty() for stream in (sys.stdout, sys.stderr))
+    except ValueError:  # closed stream
+        return True
+
+
+def _ensure_colorama_initialized() -> None:
+    """Initialize colorama once, on first use rather than at import time, and only where it is needed."""
+    global _colorama_initialized
+    if not _colorama_initialized:
+        if _colorama_needed():
+            colorama_init()
+        _colorama_initialized = True
+
+
+@lru_cache(maxsize=None)
+def _factory_config_dir() -> Path:
+    """Get the factory configuration directory shipped with the package."""
+    return Path(__file__).parent / "config"
+
+
+_COLOR_KINDS = ("foreground", "background", "foreground_inverse", "background_inverse")
+# Attribute name suffixes of the former per-level color attributes -> index into the color slots
+_KIND_SUFFIXES = tuple(("_" + kind, index) for index, kind in enumerate(_COLOR_KINDS))
+_NO_COLORS = (None, None, None, None)
+
+# Field and log-level names a scheme defines colors for, in display order
+_ALL_LEVELS = (("operator", "timestamp", "pid", "tid", "file", "level", "message") +
+               tuple(log_level.name.lower() for log_level in LogLevel))
+
+# Color name -> ANSI code lookup tables
+_FORE_MAP = {name: getattr(Fore, name) for name in dir(Fore) if not name.startswith('_')}
+_BACK_MAP = {name: getattr(Back, name) for name in dir(Back) if not name.startswith('_')}
+# ANSI code -> color name, reversed so the first name in dir() order wins
+_FORE_NAMES = {code: name for name, code in reversed(_FORE_MAP.items())}
+_BACK_NAMES = {code: name for name, code in reversed(_BACK_MAP.items())}
+
+
+@lru_cache(maxsize=None)
+def _compose(style: str, foreground: str | None, background: str | None) -> str:
+    """
+    Combine style, foreground and background into a single ANSI prefix.
+    :param style: ANSI style code
+    :param foreground: ANSI foreground code or None
+    :param background: ANSI background code or None
+    :return: the combined ANSI code
+    """
+    reval = style
+    if foreground:
+        reval += foreground
+    if background:
+        reval += background
+    return reval
+
+
+@lru_cache(maxsize=None)
+def _load_scheme_json(path: str, mtime_ns: int, size: int) -> dict[str, tuple[str | None, ...]]:
+    """
+    Load a color scheme JSON file and resolve the color names to ANSI codes.
+
+    Results are cached per file; modification time and size are part of the key, so an edited file
+    is read again. The returned dict is shared and must not be modified.
+    :param path: resolved path of the color scheme JSON file
+    :param mtime_ns: modification time of the file in nanoseconds
+    :param size: size of the file in bytes
+    :return: dict mapping level names to (foreground, background, foreground_inverse, background_inverse)
+    """
+    data = _json_loads(Path(path).read_bytes())
+
+    scheme_colors = {}
+    for level_name, colors in data.items():
+        fg_str = colors.get("foreground")
+        bg_str = colors.get("background")
+
+        # Convert color names to ANSI codes, the inverse swaps foreground and background
+        foreground = _FORE_MAP[fg_str] if fg_str else None
+        background = _BACK_MAP[bg_str] if bg_str else None
+        foreground_inverse = _FORE_MAP[bg_str] if bg_str else None
+        background_inverse = _BACK_MAP[fg_str] if fg_str else None
+
+        scheme_colors[level_name] = (foreground, background, foreground_inverse, background_inverse)
+    return scheme_colors
 
 
 def get_user_config_dir() -> Path:
@@ -77,6 +198,12 @@ class Field(ExtendedEnum):
     MESSAGE = auto()
 
 
+# Lower-case member names, precomputed for ColorScheme lookups
+for _field in Field:
+    _field._key = _field.name.lower()
+del _field
+
+
 class ColorScheme:
     """
     Simplified color scheme management for console logging.
@@ -121,6 +248,19 @@ class ColorScheme:
         LIGHT_BG_BLACK_AND_WHITE = auto()
         LIGHT_BG_COLOR = auto()
 
+    # Map default scheme to config file, relative to the factory config directory
+    _scheme_files = {
+        Default.NONE: "colors/active",  # Uses symlink
+        Default.COLOR: "colors/factory/display_dark_bg_color.json",
+        Default.BLACK_AND_WHITE: "colors/factory/display_dark_bg_bw.json",
+        Default.PLAIN_TEXT: "colors/factory/display_plain.json",
+        Default.LIGHT_BG_COLOR: "colors/factory/display_light_bg_color.json",
+        Default.LIGHT_BG_BLACK_AND_WHITE: "colors/factory/display_light_bg_bw.json"
+    }
+
+    # Shared instances returned by shared(): (default scheme, resolved json path) -> scheme
+    _shared_instances: dict[tuple[ColorScheme.Default, str | None], ColorScheme] = {}
+
     def __init__(self,
                  default_scheme: ColorScheme.Default = Default.COLOR,
                  colorscheme_json: Path = None,
@@ -134,16 +274,14 @@ class ColorScheme:
 
         if default_scheme and not isinstance(default_scheme, ColorScheme.Default):
             raise ValueError(f"Invalid Default-color-scheme: '{default_scheme}'")
-        field_levels = ["operator", "timestamp", "pid", "tid", "file", "level", "message"]
-        log_levels = [log_level.name.lower() for log_level in LogLevel]
-        self.all_levels = field_levels + log_levels
+        _ensure_colorama_initialized()
+        self.all_levels = list(_ALL_LEVELS)
+        self._prefix_cache = {}
+        self._is_plain = False
+        self._version = 0
 
-        # Set all colors to default
-        for level_str in self.all_levels:
-            setattr(self, f"{level_str}_foreground", None)
-            setattr(self, f"{level_str}_background", None)
-            setattr(self, f"{level_str}_foreground_inverse", None)
-            setattr(self, f"{level_str}_background_inverse", None)
+        # Set all colors to default: [foreground, background, foreground_inverse, background_inverse]
+        self._colors: dict[str, list[str | None]] = {level_str: list(_NO_COLORS) for level_str in self.all_levels}
 
         if colorscheme_json:
             # explicit path provided by caller
@@ -171,44 +309,133 @@ class ColorScheme:
         :param style: ANSI style to apply
         :return: combined ANSI color code
         """
-        # Convert level parameter to string
-        if isinstance(level, (LogLevel, Field)):
-            level_str = level.name.lower()
-        else:
-            level_str = str(level).lower()
+        return self.prefix_for(level, inverse, style)
+
+    def prefix_for(self, level: str | LogLevel | Field, inverse: bool = False, style: str = Style.NORMAL) -> str:
+        """
+        Get the cached ANSI prefix for the given level and style.
+
+        Formatters can bind the result once instead of calling get() per record; a bound prefix
+        does not follow later set_colors() calls, compare version to notice them.
+        :param level: the level name as string, LogLevel enum, or Field enum
+        :param inverse: if True, use inverse colors for this level
+        :param style: ANSI style to apply, None for the normal style
+        :return: combined ANSI color code
+        """
+        if self._is_plain:
+            return ""
+
+        key = (self._level_key(level), inverse, style or Style.NORMAL)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            prefix = self._prefix_cache[key] = self._compose_level(key[0], inverse, key[2])
+        return prefix
 
-        # Validate that it's a known level
-        if level_str not in self.all_levels:
-            # For backward compatibility, allow any string
-            pass
+    def colorize(self, level: str | LogLevel | Field, message: str, *args, inverse: bool = False,
+                 style: str = Style.NORMAL) -> str:
+        """
+        Wrap a message in the cached prefix of the given level and a reset code.
 
-        fg_attr = f"{level_str}_foreground{'_inverse' if inverse else ''}"
-        bg_attr = f"{level_str}_background{'_inverse' if inverse else ''}"
+        The %-style arguments are only merged here, so formatters calling this from Formatter.format()
+        do no string work for records that were filtered out.
+        :param level: the level name as string, LogLevel enum, or Field enum
+        :param message: the message, optionally with %-style placeholders
+        :param args: arguments for the placeholders in the message
+        :param inverse: if True, use inverse colors for this level
+        :param style: ANSI style to apply, None for the normal style
+        :return: the colored message
+        """
+        if args:
+            message = message % args
+        return self.prefix_for(level, inverse, style) + message + Style.RESET_ALL
 
-        foreground = getattr(self, fg_attr, None)
-        background = getattr(self, bg_attr, None)
+    def set_colors(self, level: str | LogLevel | Field, **colors: str | None) -> None:
+        """
+        Set ANSI color codes for the given level and refresh the cached prefixes.
 
-        if not style:
-            style = Style.NORMAL
-        reval = style
-        if foreground:
-            reval += foreground
-        if background:
-            reval += background
+        :param level: the level name as string, LogLevel enum, or Field enum
+        :param colors: any of foreground, background, foreground_inverse, background_inverse
+                       mapped to an ANSI code or None
+        :raises ValueError: an unknown color kind is given
+        """
+        level_str = self._level_key(level)
+        slots = self._colors.setdefault(level_str, list(_NO_COLORS))
+        for kind, code in colors.items():
+            if kind not in _COLOR_KINDS:
+                raise ValueError(f"Invalid color kind: '{kind}'")
+            slots[_COLOR_KINDS.index(kind)] = code
+        self._is_plain = self._has_no_colors()
+        for key in [key for key in self._prefix_cache if key[0] == level_str]:
+            del self._prefix_cache[key]
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the colors, which changes whenever colors are set or loaded.
 
-        return reval
+        Holders of bound prefixes compare it with the version they bound to know when to rebind.
+        :return: the version counter
+        """
+        return self._version
+
+    def __getattr__(self, name: str):
+        """
+        Backward compatible read access to the former per-level attributes, e.g. 'info_foreground_inverse'.
+        :param name: the attribute name
+        :return: the ANSI code stored for the level and color kind
+        :raises AttributeError: the name does not denote a stored color
+        """
+        colors = self.__dict__.get("_colors")
+        if colors is not None:
+            for suffix, index in _KIND_SUFFIXES:
+                if name.endswith(suffix):
+                    level_colors = colors.get(name[:-len(suffix)])
+                    if level_colors is not None:
+                        return level_colors[index]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Backward compatible write access to the former per-level attributes, e.g. 'warning_foreground'.
+
+        Writes to those names go through set_colors(), so the cached prefixes follow them.
+        :param name: the attribute name
+        :param value: the value to store
+        """
+        colors = self.__dict__.get("_colors")
+        if colors is not None and not name.startswith("_"):
+            for suffix, index in _KIND_SUFFIXES:
+                if name.endswith(suffix) and name[:-len(suffix)] in colors:
+                    self.set_colors(name[:-len(suffix)], **{_COLOR_KINDS[index]: value})
+                    return
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _level_key(level: str | LogLevel | Field) -> str:
+        """Convert a level parameter to its lower-case string key."""
+        return getattr(level, "_key", None) or str(level).lower()
+
+    def _compose_level(self, level_str: str, inverse: bool, style: str) -> str:
+        """Combine the stored colors of a level with the given style."""
+        fg, bg, fg_inv, bg_inv = self._colors.get(level_str, _NO_COLORS)
+        foreground, background = (fg_inv, bg_inv) if inverse else (fg, bg)
+        return _compose(style, foreground, background)
+
+    def _has_no_colors(self) -> bool:
+        """Check whether no level has any color set, i.e. the scheme produces plain text."""
+        return not any(any(colors) for colors in self._colors.values())
+
+    def _build_prefix_cache(self) -> None:
+        """Precompute the normal and bright prefixes of all known levels."""
+        self._prefix_cache = {(level_str, inverse, style): self._compose_level(level_str, inverse, style)
+                              for level_str in self.all_levels
+                              for inverse in (False, True)
+                              for style in (Style.NORMAL, Style.BRIGHT)}
 
     def _load_default_scheme(self, default_scheme: ColorScheme.Default):
         """Load the default color scheme from config directory."""
-        # Map default scheme to config file
-        scheme_files = {
-            ColorScheme.Default.NONE: "colors/active",  # Uses symlink
-            ColorScheme.Default.COLOR: "colors/factory/display_dark_bg_color.json",
-            ColorScheme.Default.BLACK_AND_WHITE: "colors/factory/display_dark_bg_bw.json",
-            ColorScheme.Default.PLAIN_TEXT: "colors/factory/display_plain.json",
-            ColorScheme.Default.LIGHT_BG_COLOR: "colors/factory/display_light_bg_color.json",
-            ColorScheme.Default.LIGHT_BG_BLACK_AND_WHITE: "colors/factory/display_light_bg_bw.json"
-        }
+        scheme_files = ColorScheme._scheme_files
 
         # Handle None as default (should be COLOR)
         if default_scheme is None:
@@ -218,7 +445,7 @@ class ColorScheme:
             raise ValueError(f"Unknown default color scheme: {default_scheme}")
 
         # Get factory and user config directories
-        factory_config_dir = Path(__file__).parent / "config"
+        factory_config_dir = _factory_config_dir()
         user_config_dir = get_user_config_dir()
         user_colors_dir = user_config_dir / "colors"
 
@@ -247,11 +474,84 @@ class ColorScheme:
         scheme_file = factory_config_dir / scheme_files[default_scheme]
         self._load_from_config(Path(scheme_file))
 
-        # Update symlink if needed - point colors/active to this scheme
+    @classmethod
+    def plain_text_singleton(cls) -> ColorScheme:
+        """
+        Get a shared PLAIN_TEXT color scheme, so the plain scheme file is only loaded once.
+
+        The instance is shared: do not modify its colors.
+        :return: the shared plain text color scheme
+        """
+        return cls.shared(ColorScheme.Default.PLAIN_TEXT)
+
+    @classmethod
+    def shared(cls, default_scheme: ColorScheme.Default = Default.COLOR, colorscheme_json: Path = None) -> ColorScheme:
+        """
+        Get a shared color scheme, constructed on the first request for the given arguments.
+
+        The instances are shared between all callers: do not modify their colors, modify a copy() or
+        construct a ColorScheme of your own for that.
+        :param default_scheme: the default color scheme to use
+        :param colorscheme_json: optional path to custom color scheme JSON file
+        :return: the shared color scheme
+        """
+        key = (default_scheme, str(Path(colorscheme_json).resolve()) if colorscheme_json else None)
+        instance = cls._shared_instances.get(key)
+        if instance is None:
+            instance = cls._shared_instances[key] = cls(default_scheme, colorscheme_json)
+        return instance
+
+    def copy(self) -> ColorScheme:
+        """
+        Get an independent copy of this color scheme, without loading any file.
+
+        Copies of a shared() instance can be modified without affecting the other users of that instance.
+        :return: the copy
+        """
+        scheme = ColorScheme.__new__(ColorScheme)
+        object.__setattr__(scheme, "all_levels", list(self.all_levels))
+        object.__setattr__(scheme, "_prefix_cache", dict(self._prefix_cache))
+        object.__setattr__(scheme, "_is_plain", self._is_plain)
+        object.__setattr__(scheme, "_version", 0)
+        object.__setattr__(scheme, "_colors", {level_str: list(colors) for level_str, colors in self._colors.items()})
+        return scheme
+
+    def to_config(self) -> dict[str, dict[str, str | None]]:
+        """
+        Get the colors of all levels as color names, in the layout of the color scheme JSON files.
+
+        The inverse colors are not included, loading a scheme derives them from foreground and background.
+        :return: dict mapping level names to their foreground and background color names
+        """
+        return {level_str: {"foreground": _FORE_NAMES.get(colors[0]), "background": _BACK_NAMES.get(colors[1])}
+                for level_str, colors in self._colors.items()}
+
+    def save_to_json(self, config_file: Path | str) -> None:
+        """
+        Save the colors of all levels to a color scheme JSON file.
+        :param config_file: path of the JSON file to write
+        """
+        Path(config_file).write_bytes(_json_dumps(self.to_config()))
+
+    @classmethod
+    def set_active_scheme(cls, default_scheme: ColorScheme.Default) -> None:
+        """
+        Point the factory colors/active symlink to the given default scheme, so that
+        ColorScheme.Default.NONE loads it.
+
+        Loading a scheme never touches the file system; call this to persist the choice.
+        :param default_scheme: the default color scheme to activate
+        :raises ValueError: default_scheme is not a concrete default scheme
+        """
+        if default_scheme not in cls._scheme_files or default_scheme == ColorScheme.Default.NONE:
+            raise ValueError(f"Cannot activate default color scheme: {default_scheme}")
+
+        factory_config_dir = _factory_config_dir()
+        scheme_file = factory_config_dir / cls._scheme_files[default_scheme]
         active_link = factory_config_dir / "colors" / "active"
         active_target = os.path.realpath(active_link) if active_link.exists() else None
 
-        if active_target != str(scheme_file):
+        if active_target != os.path.realpath(scheme_file):
             # Update symlink with relative path
             if active_link.exists() or active_link.is_symlink():
                 active_link.unlink(missing_ok=True)
@@ -260,31 +560,25 @@ class ColorScheme:
 
     def _load_from_config(self, config_file: Path, update_active_link: bool = False):
         """Load color scheme from JSON file."""
-        with open(config_file, encoding="utf-8") as f:
-            data = json.load(f)
+        config_path = Path(config_file).resolve()
+        config_stat = config_path.stat()
+        scheme_colors = _load_scheme_json(str(config_path), config_stat.st_mtime_ns, config_stat.st_size)
 
         # Set colors for each level in the config
-        for level_name, colors in data.items():
-            fg_str = colors.get("foreground")
-            bg_str = colors.get("background")
-            fg_inv_str = bg_str
-            bg_inv_str = fg_str
-
-            # Convert color names to ANSI codes
-            foreground = getattr(Fore, fg_str) if fg_str else None
-            background = getattr(Back, bg_str) if bg_str else None
-            foreground_inverse = getattr(Fore, fg_inv_str) if fg_inv_str else None
-            background_inverse = getattr(Back, bg_inv_str) if bg_inv_str else None
-
-            setattr(self, f"{level_name}_foreground", foreground)
-            setattr(self, f"{level_name}_background", background)
-            setattr(self, f"{level_name}_foreground_inverse", foreground_inverse)
-            setattr(self, f"{level_name}_background_inverse", background_inverse)
+        self._colors.update({level_name: list(colors) for level_name, colors in scheme_colors.items()})
+
+        self._is_plain = self._has_no_colors()
+        if self._is_plain:
+            # plain schemes never consult the prefix cache
+            self._prefix_cache = {}
+        else:
+            self._build_prefix_cache()
+        self._version += 1
 
         # Update active symlink if requested
         if update_active_link:
             # Get factory config directory
-            factory_config_dir = Path(__file__).parent / "config"
+            factory_config_dir = _factory_config_dir()
             # Get user config directory (~/.config/flashlogger)
             user_config_dir = get_user_config_dir()
             
@@ -23,43 +23,61 @@
 
 from __future__ import annotations
 
-import inspect
+import atexit
+import queue
+import sys
+import threading
+from collections import defaultdict
 from collections.abc import Iterable
 from os import PathLike
 from pathlib import Path
+from types import FunctionType
+from typing import TYPE_CHECKING
 
 from flashlogger.color_scheme import ColorScheme
-from flashlogger.log_channel_abc import LogChannelABC, OutputFormat
+from flashlogger.log_channel_abc import (LogChannelABC, OutputFormat, _coerce_level, _issuing_thread,
+                                         _output_format_by_name)
 from flashlogger.log_channel_console import LogChannelConsole
-from flashlogger.log_channel_file import FileLogChannel
+from flashlogger.log_channel_file import DEFAULT_BUFFER_SIZE, FileLogChannel
 from flashlogger.log_levels import LogLevel
 
+# A channel failing more often than this is removed from the logger
+_MAX_CHANNEL_ERRORS = 100
+
+
+def _default_file_channel(log_file: str | PathLike | Path) -> FileLogChannel:
+    """
+    Create the buffered file channel for the log_file argument of FlashLogger and get_logger().
+
+    The buffer is also written by an exit handler, logging's own shutdown hook only covers loggers it knows.
+    :param log_file: path of the log file
+    :return: the file channel, logging WARNING and above
+    """
+    file_channel = FileLogChannel(log_file, minimum_log_level=LogLevel.WARNING, buffer_size=DEFAULT_BUFFER_SIZE)
+    atexit.register(file_channel.flush)
+    return file_channel
+
 
 def _get_call_site_info(skip_frames: int = 2):
     """
     Get the file name and line number from the call site using stack inspection.
 
+    Frames of the log wrappers in this module (FlashLogger.log_* and the global log functions) are
+    skipped as well, so the call site is the code that called the outermost wrapper.
     :param skip_frames: Number of frames to skip in the stack trace
     :return: Tuple of (filename, lineno) or (None, None) if inspection fails
     """
     try:
-        frame = inspect.currentframe()
-        if frame is None:
-            return None, None
-
         # Skip frames to get to the actual caller
-        for _ in range(skip_frames):
-            frame = frame.f_back
-            if frame is None:
-                return None, None
-
-        filename = frame.f_code.co_filename
-        lineno = frame.f_lineno
-
-        return filename, lineno
-    except Exception:
-        # If anything goes wrong with stack inspection, return None
+        frame = sys._getframe(skip_frames)
+    except ValueError:
+        # The call stack is not that deep
         return None, None
+    while frame is not None and frame.f_code in _LOG_WRAPPER_CODES:
+        frame = frame.f_back
+    if frame is None:
+        return None, None
+    return frame.f_code.co_filename, frame.f_lineno
 
 
 class FlashLogger:
@@ -70,13 +88,15 @@ class FlashLogger:
     def __init__(self,
                  log_channels: LogChannelABC | Iterable[LogChannelABC] = None,
                  console: ColorScheme.Default = None,
-                 log_file: str | PathLike | Path = None):
+                 log_file: str | PathLike | Path = None,
+                 enqueue: bool = False):
         """
         Initialize FlashLogger with optional automatic channel creation.
 
         :param log_channels: explicitly provided channels to add
         :param console: if not None and not ColorScheme.Default.PLAIN_TEXT, creates a default console channel
         :param log_file: if provided, creates a default file channel writing to this path
+        :param enqueue: if True, records are handed to the channels by a background thread, see flush()
         """
         # Collect all channels to add
         channels_to_add = []
@@ -85,7 +105,7 @@ class FlashLogger:
         if log_channels is not None:
             if isinstance(log_channels, LogChannelABC):
                 channels_to_add.append(log_channels)
-            elif hasattr(log_channels, '__iter__'):
+            elif isinstance(log_channels, Iterable):
                 channels_to_add.extend(log_channels)
 
         # Create default console channel if requested (handle PLAIN_TEXT properly)
@@ -95,7 +115,7 @@ class FlashLogger:
 
         # Create default file channel if requested
         if log_file is not None:
-            file_channel = FileLogChannel(log_file, minimum_log_level=LogLevel.WARNING)
+            file_channel = _default_file_channel(log_file)
             channels_to_add.append(file_channel)
 
         # Ensure we have at least one channel
@@ -106,33 +126,47 @@ class FlashLogger:
         self._channel_id_counter = 0
         self._channel_ids = {}  # id -> channel mapping
         self._channel_selectors = {}  # selector -> channel mapping
+        self._channel_id_by_obj = {}  # id(channel) -> channel id
+        self._selectors_by_obj = defaultdict(list)  # id(channel) -> selectors given for the channel
+        self._class_names = {}  # id(channel) -> lower-case class name
+        self._channels_by_class_selector = {}  # memoized class name lookups of get_channel()
+        self._channel_error_counts = defaultdict(int)  # id(channel) -> number of failed do_log calls
 
         for log_channel in channels_to_add:
             self.add_channel(log_channel)
 
+        # Records waiting for the background dispatcher, None if logging synchronously
+        self._queue: queue.Queue | None = None
+        self._dispatcher: threading.Thread | None = None
+        if enqueue:
+            self._queue = queue.Queue()
+            self._dispatcher = threading.Thread(target=self._drain, args=(self._queue,), name="flashlogger-dispatch",
+                                                daemon=True)
+            self._dispatcher.start()
+            atexit.register(self.flush)
+
     def add_channel(self, log_channel: LogChannelABC, selector: str = None):
         """
         Add a log channel to this logger.
         :param log_channel: the channel to add
         :param selector: optional name/ID for accessing this channel later
         """
-        # Don't add if already present
-        if log_channel in self.log_channels:
-            # Update selector if provided and not already set
-            if selector is not None:
-                self._channel_selectors[selector] = log_channel
-            return
-
-        self.log_channels.append(log_channel)
-
-        # Assign ID
-        channel_id = self._channel_id_counter
-        self._channel_ids[channel_id] = log_channel
-        self._channel_id_counter += 1
+        # Don't add if already present, but still store the selector
+        if id(log_channel) not in self._channel_id_by_obj:
+            self.log_channels.append(log_channel)
+
+            # Assign ID
+            channel_id = self._channel_id_counter
+            self._channel_ids[channel_id] = log_channel
+            self._channel_id_by_obj[id(log_channel)] = channel_id
+            self._channel_id_counter += 1
+            self._class_names[id(log_channel)] = type(log_channel).__name__.lower()
+            self._channels_by_class_selector.clear()
 
         # Store selector if provided
         if selector is not None:
             self._channel_selectors[selector] = log_channel
+            self._selectors_by_obj[id(log_channel)].append(selector)
 
     def remove_channel(self, channel: LogChannelABC | int | str):
         """
@@ -154,20 +188,20 @@ class FlashLogger:
             channel_to_remove = channel
 
         # Remove the channel if found
-        if channel_to_remove and channel_to_remove in self.log_channels:
+        channel_id = self._channel_id_by_obj.pop(id(channel_to_remove), None)
+        if channel_id is not None:
             self.log_channels.remove(channel_to_remove)
 
             # Remove from ID mapping
-            for cid, chan in list(self._channel_ids.items()):
-                if chan is channel_to_remove:
-                    del self._channel_ids[cid]
-                    break
-
-            # Remove from selector mapping
-            for sel, chan in list(self._channel_selectors.items()):
-                if chan is channel_to_remove:
+            del self._channel_ids[channel_id]
+            del self._class_names[id(channel_to_remove)]
+            self._channel_error_counts.pop(id(channel_to_remove), None)
+            self._channels_by_class_selector.clear()
+
+            # Remove from selector mapping, unless a selector was given to another channel since
+            for sel in self._selectors_by_obj.pop(id(channel_to_remove), ()):
+                if self._channel_selectors.get(sel) is channel_to_remove:
                     del self._channel_selectors[sel]
-                    break
 
     def get_channel(self, selector: int | str | LogChannelABC):
         """
@@ -192,17 +226,15 @@ class FlashLogger:
             if selector in self._channel_selectors:
                 return self._channel_selectors[selector]
 
-            # Then match class name (ignoring case)
+            # Then match class name (ignoring case), e.g. 'console' or 'file'
+            channel = self._channels_by_class_selector.get(selector)
+            if channel is not None:
+                return channel
             selector_lower = selector.lower()
             for channel in self.log_channels:
-                channel_class_name = type(channel).__name__.lower()
-                # Match common patterns
+                channel_class_name = self._class_names[id(channel)]
                 if selector_lower in channel_class_name or channel_class_name in selector_lower:
-                    return channel
-                # Direct match for common names
-                if selector_lower == 'console' and 'console' in channel_class_name:
-                    return channel
-                if selector_lower == 'file' and 'file' in channel_class_name:
+                    self._channels_by_class_selector[selector] = channel
                     return channel
             raise ValueError(f"No channel found matching '{selector}'")
 
@@ -220,41 +252,174 @@ class FlashLogger:
         :param args: Message and arguments passed to channel.do_log()
         :param kwargs: Additional keyword arguments passed to channel.do_log(). May include 'file' and 'line' to override call site detection.
         """
+        # Only dispatch to channels accepting the level, so filtered records cost no stack inspection
+        channels = self._loggable_channels(level)
+        if not channels:
+            return
+
         # Get call site information if not already provided
-        file = kwargs.get('file')
-        line = kwargs.get('line')
-        if file is None or line is None:
-            # Skip frames to get to the actual caller
-            # Normal case: FlashLogger.log() method -> log_* method -> caller (skip 3)
-            # Global function case: log_global() -> FlashLogger.log_*() -> FlashLogger.log() -> caller (skip 4)
-            import inspect
-            frame = inspect.currentframe()
-            skip_frames = 3
-            if frame and \
-                    frame.f_back and \
-                    frame.f_back.f_code.co_name.startswith('log_') and \
-                    frame.f_back.f_code.co_filename == __file__:
-                # We were called from a log_* method in this file, which means it was called from a global function
-                skip_frames = 4
-
-            detected_file, detected_line = _get_call_site_info(skip_frames=skip_frames)
+        file = kwargs.pop('file', None)
+        line = kwargs.pop('line', None)
+        if (file is None or line is None) and any(channel.needs_call_site for channel in channels):
+            # Skip _get_call_site_info() and this method, the log wrappers in between are skipped by identity
+            detected_file, detected_line = _get_call_site_info(skip_frames=2)
 
             if file is None:
                 file = detected_file
             if line is None:
                 line = detected_line
 
-        # Pass the file and line information to channels
-        kwargs['file'] = file
-        kwargs['line'] = line
+        record_queue = self._queue
+        if record_queue is not None:
+            # The channels report the thread of the caller, not the one of the dispatcher
+            record_queue.put((threading.get_ident(), channels, level, args, file, line, kwargs))
+            return
+
+        self._dispatch(channels, level, args, file, line, kwargs)
+
+    def should_log(self, level: LogLevel | str | int) -> bool:
+        """
+        Check whether a record at the given level would be logged, so callers can skip building costly arguments.
+
+        :param level: the log level
+        :return: True if at least one channel accepts the level
+        """
+        try:
+            loggable_level = _coerce_level(level)
+            return any(channel.is_loggable(loggable_level) for channel in self.log_channels)
+        except (KeyError, ValueError):
+            # Unknown level: log() lets the channels report it
+            return True
+
+    def log_many(self, records: Iterable[tuple], file: str = None, line: int = None):
+        """
+        Log several records with a single call site inspection.
+
+        :param records: (level, args) or (level, args, kwargs) tuples, as they would be passed to log();
+                        args that are not a tuple or list are taken as the only argument, e.g. a message
+        :param file: file name to report for all records instead of the detected call site
+        :param line: line number to report for all records instead of the detected call site
+        """
+        call_site_detected = file is not None and line is not None
+        for record in records:
+            level, args = record[0], record[1]
+            if not isinstance(args, (tuple, list)):
+                # A bare message would otherwise be spread into its characters
+                args = (args,)
+            kwargs = dict(record[2]) if len(record) > 2 else {}
+            channels = self._loggable_channels(level)
+            if not channels:
+                continue
+
+            if not call_site_detected and any(channel.needs_call_site for channel in channels):
+                detected_file, detected_line = _get_call_site_info(skip_frames=2)
+                if file is None:
+                    file = detected_file
+                if line is None:
+                    line = detected_line
+                call_site_detected = True
+            record_file = kwargs.pop('file', file)
+            record_line = kwargs.pop('line', line)
+
+            record_queue = self._queue
+            if record_queue is not None:
+                record_queue.put((threading.get_ident(), channels, level, args, record_file, record_line, kwargs))
+            else:
+                self._dispatch(channels, level, args, record_file, record_line, kwargs)
+
+    def flush(self):
+        """
+        Wait until the background dispatcher, if any, has handed all enqueued records to the channels,
+        then let the channels write what they have buffered.
 
+        Called by a channel from the dispatcher thread, it does not wait for the dispatcher, which would then wait
+        for itself.
+        """
+        record_queue = self._queue
+        if record_queue is not None and threading.current_thread() is not self._dispatcher:
+            record_queue.join()
         for channel in self.log_channels:
+            channel.flush()
+
+    def close(self):
+        """
+        Stop the background dispatcher, if any, once it has handed the enqueued records to the channels, then let
+        the channels write what they have buffered. Records logged afterwards are handed to the channels directly.
+        """
+        record_queue = self._queue
+        if record_queue is not None and threading.current_thread() is not self._dispatcher:
+            self._queue = None
+            # The stop request is queued behind the records enqueued so far, which are dispatched first
+            record_queue.put(None)
+            self._dispatcher.join()
+            self._dispatcher = None
+            atexit.unregister(self.flush)
+        self.flush()
+
+    def _drain(self, record_queue: queue.Queue):
+        """
+        Hand the enqueued records to their channels until close() stops it, runs in the background dispatcher thread.
+        :param record_queue: the queue of the records to dispatch
+        """
+        while True:
+            item = record_queue.get()
+            if item is None:
+                record_queue.task_done()
+                return
+            thread_id, channels, level, args, file, line, kwargs = item
+            _issuing_thread.ident = thread_id
+            try:
+                self._dispatch(channels, level, args, file, line, kwargs)
+            finally:
+                _issuing_thread.ident = None
+                record_queue.task_done()
+
+    def _loggable_channels(self, level: LogLevel | str | int) -> list[LogChannelABC]:
+        """
+        Get the channels accepting the given level.
+
+        :param level: the log level
+        :return: the channels to dispatch to, all channels if the level is unknown so they can report it
+        """
+        try:
+            # Resolve names and numbers once rather than in every channel's is_loggable()
+            loggable_level = _coerce_level(level)
+            return [channel for channel in self.log_channels if channel.is_loggable(loggable_level)]
+        except (KeyError, ValueError):
+            return list(self.log_channels)
+
+    def _dispatch(self, channels: list[LogChannelABC], level: LogLevel | str | int, args: tuple,
+                  file: str | None, line: int | None, kwargs: dict):
+        """
+        Pass a record to the given channels, reporting channel failures instead of raising them.
+
+        Failures of a channel are reported the first times and then only at every power of two, a channel
+        failing more than _MAX_CHANNEL_ERRORS times is removed.
+
+        :param channels: the channels accepting the level
+        :param level: the log level
+        :param args: message and arguments
+        :param file: file name of the call site
+        :param line: line number of the call site
+        :param kwargs: additional keyword arguments
+        """
+        # Iterate over a copy, as failing channels are removed from the channel list
+        for channel in tuple(channels):
             try:
-                channel.do_log(level, *args, **kwargs)
+                channel.do_log(level, *args, file=file, line=line, **kwargs)
             except Exception as e:
+                self._channel_error_counts[id(channel)] += 1
+                error_count = self._channel_error_counts[id(channel)]
+                if error_count > _MAX_CHANNEL_ERRORS:
+                    print(f"Removing channel {type(channel).__name__} after {error_count} errors: {e}",
+                          file=sys.stderr)
+                    self.remove_channel(channel)
+                    continue
+                if error_count >= 3 and error_count & (error_count - 1):
+                    continue
                 # Log errors to stderr and also attempt to display the message directly
-                import sys
-                print(f"Error logging to channel {type(channel).__name__}: {e}", file=sys.stderr)
+                print(f"Error logging to channel {type(channel).__name__} ({error_count} errors): {e}",
+                      file=sys.stderr)
                 # Fallback: print the message directly to stdout to ensure it's visible
                 try:
                     message = str(args[0]) if args else ""
@@ -263,91 +428,32 @@ class FlashLogger:
                 except Exception:
                     pass  # If even fallback fails, don't crash
 
-    # Generate shortcuts for all LogLevel enum members
-    def log_notset(self, *args, **kwargs):
-        """Log at NOTSET level."""
-        self.log(LogLevel.NOTSET, *args, **kwargs)
-
-    def log_debug(self, *args, **kwargs):
-        """Log at DEBUG level."""
-        self.log(LogLevel.DEBUG, *args, **kwargs)
-
-    def log_info(self, *args, **kwargs):
-        """Log at INFO level."""
-        self.log(LogLevel.INFO, *args, **kwargs)
-
-    def log_warning(self, *args, **kwargs):
-        """Log at WARNING level."""
-        self.log(LogLevel.WARNING, *args, **kwargs)
-
-    def log_error(self, *args: object, **kwargs: object) -> None:
-        """Log at ERROR level."""
-        self.log(LogLevel.ERROR, *args, **kwargs)
-
-    def log_fatal(self, *args, **kwargs):
-        """Log at FATAL level."""
-        self.log(LogLevel.FATAL, *args, **kwargs)
-
-    def log_critical(self, *args, **kwargs):
-        """Log at CRITICAL level."""
-        self.log(LogLevel.CRITICAL, *args, **kwargs)
-
-    def log_command(self, *args, **kwargs):
-        """Log at COMMAND level."""
-        self.log(LogLevel.COMMAND, *args, **kwargs)
-
-    def log_command_output(self, *args, **kwargs):
-        """Log at COMMAND_OUTPUT level."""
-        self.log(LogLevel.COMMAND_OUTPUT, *args, **kwargs)
-
-    def log_command_stderr(self, *args, **kwargs):
-        """Log at COMMAND_STDERR level."""
-        self.log(LogLevel.COMMAND_STDERR, *args, **kwargs)
-
-    # Custom level shortcuts
-    def log_custom0(self, *args, **kwargs):
-        """Log at CUSTOM0 level."""
-        self.log(LogLevel.CUSTOM0, *args, **kwargs)
-
-    def log_custom1(self, *args, **kwargs):
-        """Log at CUSTOM1 level."""
-        self.log(LogLevel.CUSTOM1, *args, **kwargs)
-
-    def log_custom2(self, *args, **kwargs):
-        """Log at CUSTOM2 level."""
-        self.log(LogLevel.CUSTOM2, *args, **kwargs)
-
-    def log_custom3(self, *args, **kwargs):
-        """Log at CUSTOM3 level."""
-        self.log(LogLevel.CUSTOM3, *args, **kwargs)
-
-    def log_custom4(self, *args, **kwargs):
-        """Log at CUSTOM4 level."""
-        self.log(LogLevel.CUSTOM4, *args, **kwargs)
-
-    def log_custom5(self, *args, **kwargs):
-        """Log at CUSTOM5 level."""
-        self.log(LogLevel.CUSTOM5, *args, **kwargs)
-
-    def log_custom6(self, *args, **kwargs):
-        """Log at CUSTOM6 level."""
-        self.log(LogLevel.CUSTOM6, *args, **kwargs)
-
-    def log_custom7(self, *args, **kwargs):
-        """Log at CUSTOM7 level."""
-        self.log(LogLevel.CUSTOM7, *args, **kwargs)
-
-    def log_custom8(self, *args, **kwargs):
-        """Log at CUSTOM8 level."""
-        self.log(LogLevel.CUSTOM8, *args, **kwargs)
-
-    def log_custom9(self, *args, **kwargs):
-        """Log at CUSTOM9 level."""
-        self.log(LogLevel.CUSTOM9, *args, **kwargs)
+    if TYPE_CHECKING:
+        # Declarations of the log_<level> shortcuts generated below the class, for type checkers and IDEs
+        def log_notset(self, *args: object, **kwargs: object) -> None: ...
+        def log_debug(self, *args: object, **kwargs: object) -> None: ...
+        def log_info(self, *args: object, **kwargs: object) -> None: ...
+        def log_warning(self, *args: object, **kwargs: object) -> None: ...
+        def log_error(self, *args: object, **kwargs: object) -> None: ...
+        def log_fatal(self, *args: object, **kwargs: object) -> None: ...
+        def log_critical(self, *args: object, **kwargs: object) -> None: ...
+        def log_command(self, *args: object, **kwargs: object) -> None: ...
+        def log_command_output(self, *args: object, **kwargs: object) -> None: ...
+        def log_command_stderr(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom0(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom1(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom2(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom3(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom4(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom5(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom6(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom7(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom8(self, *args: object, **kwargs: object) -> None: ...
+        def log_custom9(self, *args: object, **kwargs: object) -> None: ...
 
     def log_header(self, header: str):
         """Log a header message (typically at INFO level)."""
-        self.log_info(f"# {header} #")
+        self.log(LogLevel.INFO, f"# {header} #")
 
     def log_progress_output(self, message: str, verbosity: LogLevel | str | int = LogLevel.INFO, extra_comment: str = None):
         """Log progress output with optional extra comment."""
@@ -362,15 +468,39 @@ class FlashLogger:
         Set the output format for all channels in this logger.
 
         :param output_format: OutputFormat enum or string equivalent
+        :raises ValueError: the output format is neither an OutputFormat nor a string
         """
+        # Resolve the format once instead of in every channel
         if isinstance(output_format, str):
-            output_format = OutputFormat[output_format.upper()] if output_format else OutputFormat.HUMAN_READABLE
+            output_format = _output_format_by_name(output_format) if output_format else OutputFormat.HUMAN_READABLE
+        elif not isinstance(output_format, OutputFormat):
+            raise ValueError(f"Invalid output_format type: {type(output_format)}. Expected OutputFormat or str.")
 
         # Set output format on all channels
         for channel in self.log_channels:
             channel.set_output_format(output_format)
 
 
+def _make_log_shortcut(log_level: LogLevel):
+    """
+    Create the FlashLogger.log_<level> shortcut method for a log level.
+    :param log_level: the log level the shortcut logs at
+    :return: the shortcut method
+    """
+    def log_shortcut(self, *args, **kwargs):
+        self.log(log_level, *args, **kwargs)
+
+    log_shortcut.__name__ = f"log_{log_level.name.lower()}"
+    log_shortcut.__qualname__ = f"FlashLogger.{log_shortcut.__name__}"
+    log_shortcut.__doc__ = f"Log at {log_level.name} level."
+    return log_shortcut
+
+
+# Generate shortcuts for all LogLevel enum members
+for _log_level in LogLevel:
+    setattr(FlashLogger, f"log_{_log_level.name.lower()}", _make_log_shortcut(_log_level))
+del _log_level
+
 # Lazy global logger - created when first accessed
 _global_logger: FlashLogger | None = None
 
@@ -385,9 +515,12 @@ def get_logger(console: ColorScheme.Default = None, log_file: str | PathLike | P
     :return: the global FlashLogger instance
     """
     global _global_logger
+    # Fast path for the module-level log functions, which call this for every message
+    if console is None and log_file is None and _global_logger is not None:
+        return _global_logger
+
     if _global_logger is None:
         # Create a default console logger if none exists
-        from flashlogger.log_channel_console import LogChannelConsole
         console_channel = LogChannelConsole(minimum_log_level=None,
                                             color_scheme=ColorScheme.Default.COLOR)  # Show all levels
         _global_logger = FlashLogger([console_channel])
@@ -395,7 +528,6 @@ def get_logger(console: ColorScheme.Default = None, log_file: str | PathLike | P
     # Add additional channels if requested and they don't exist
     if console is not None and console != ColorScheme.Default.PLAIN_TEXT:
         # Check if any console channel already exists
-        from flashlogger.log_channel_console import LogChannelConsole
         has_console = any(isinstance(ch, LogChannelConsole) for ch in _global_logger.log_channels)
         if not has_console:
             console_channel = LogChannelConsole(color_scheme=console, minimum_log_level=None)  # Show all levels
@@ -407,7 +539,7 @@ def get_logger(console: ColorScheme.Default = None, log_file: str | PathLike | P
         has_file = any(isinstance(ch, FileLogChannel) and hasattr(ch, 'log_file') and ch.log_file == file_path
                        for ch in _global_logger.log_channels)
         if not has_file:
-            file_channel = FileLogChannel(log_file, minimum_log_level=LogLevel.WARNING)
+            file_channel = _default_file_channel(log_file)
             _global_logger.add_channel(file_channel)
 
     return _global_logger
@@ -493,3 +625,11 @@ def log_custom8(*args, **kwargs):
 
 def log_custom9(*args, **kwargs):
     get_logger().log_custom9(*args, **kwargs)
+
+
+# Code objects of the log wrappers in this module; the call site is the first frame outside of them
+_LOG_WRAPPER_CODES = frozenset(
+    [member.__code__ for name, member in vars(FlashLogger).items() if name.startswith("log_")] +
+    [member.__code__ for name, member in list(globals().items())
+     if (name == "log" or name.startswith("log_")) and isinstance(member, FunctionType)
+     and member.__module__ == __name__])
@@ -23,17 +23,232 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from enum import auto
+from enum import Enum, auto
+from functools import lru_cache
+from typing import NamedTuple
 
 from fundamentals.extended_enum import ExtendedEnum
 
 from flashlogger.log_levels import LogLevel
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+# Thread that issued the record being logged, set while a background dispatcher logs on its behalf
+_issuing_thread = threading.local()
+
+# Process ID, cached as os.getpid() is a system call on Linux; refreshed in forked children
+_pid = os.getpid()
+
+
+def _refresh_pid():
+    """Update the cached process ID after a fork."""
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+_ALL_LEVELS = frozenset(LogLevel)
+
+# Collection types checked by type identity before the slower generic iterable checks
+_ITER_TYPES = (list, tuple, set, frozenset)
+
+
+@lru_cache(maxsize=None)
+def _levels_at_or_above(threshold_level: LogLevel, custom_levels: tuple) -> frozenset:
+    """
+    Get all levels whose logging level is at least the one of the threshold.
+
+    The custom level values are part of the key, as they can be reassigned at runtime.
+    :param threshold_level: the threshold level
+    :param custom_levels: the current values of LogLevel.custom_levels
+    :return: the levels at or above the threshold
+    """
+    threshold = threshold_level.logging_level()
+    return frozenset(level for level in LogLevel if level.logging_level() >= threshold)
+
+
+# Levels by upper, lower and title case name, other spellings go through _level_by_name()
+_LEVEL_BY_NAME = {spelling: level for name, level in LogLevel.__members__.items()
+                  for spelling in (name, name.lower(), name.title())}
+
+
+@lru_cache(maxsize=256)
+def _level_by_name(name: str) -> LogLevel:
+    """
+    Get the level with the given name, ignoring case.
+    :param name: the level name
+    :return: the LogLevel
+    :raises KeyError: no level has this name
+    """
+    return LogLevel[name.upper()]
+
+
+def _coerce_level(level):
+    """
+    Convert a level given by name or logging level number to the LogLevel, other values are returned unchanged.
+
+    Names are cached, numbers are not: LogLevel.custom_level() may assign a free custom level slot.
+    :param level: the LogLevel, its name or its logging level number
+    :return: the LogLevel
+    :raises KeyError: no level has this name
+    :raises ValueError: the number needs a custom level, but none is free
+    """
+    if type(level) is LogLevel:
+        return level
+    if isinstance(level, str):
+        log_level = _LEVEL_BY_NAME.get(level)
+        return log_level if log_level is not None else _level_by_name(level)
+    if isinstance(level, int):
+        return LogLevel.custom_level(level)
+    return level
+
+
+# Logging level numbers whose level name the formatters print in upper case
+_UPPERCASE_LEVELNOS = frozenset(level.logging_level()
+                                for level in (LogLevel.ERROR, LogLevel.WARNING, LogLevel.FATAL, LogLevel.CRITICAL))
+
+
+def _record_level(levelno: int) -> tuple[LogLevel, str]:
+    """
+    Resolve the logging level number of a record to its LogLevel and the level name the formatters print.
+
+    Not memoized: custom level slots and level string representations can change at runtime.
+    :param levelno: the logging level number of the record
+    :return: the LogLevel and its level name
+    """
+    log_level = LogLevel.custom_level(levelno)
+    level_name = str(log_level).lower()
+    if levelno in _UPPERCASE_LEVELNOS:
+        level_name = level_name.upper()
+    return log_level, level_name
+
+
+@lru_cache(maxsize=32)
+def _formatter_for(format_str: str) -> logging.Formatter:
+    """
+    Get the shared formatter for a format string.
+    :param format_str: the format string
+    :return: the formatter, created and validated once per format string
+    """
+    return logging.Formatter(format_str)
+
+
+class LevelSpec(NamedTuple):
+    """
+    Explicit level filter, usable wherever channels accept a level filter.
+
+    Create it with LevelSpec.threshold(), LevelSpec.include() or LevelSpec.exclude() rather than
+    by guessing the mode from the type of the filter.
+    """
+    kind: str  # "threshold", "include" or "exclude"
+    levels: tuple
+
+    @classmethod
+    def threshold(cls, level: LogLevel | str | int) -> LevelSpec:
+        """
+        Log all levels at or above the given level.
+        :param level: the lowest level to log
+        :return: the level filter
+        """
+        return cls("threshold", (level,))
+
+    @classmethod
+    def include(cls, *levels: LogLevel | str | int) -> LevelSpec:
+        """
+        Log only the given levels.
+        :param levels: the levels to log
+        :return: the level filter
+        """
+        return cls("include", levels)
+
+    @classmethod
+    def exclude(cls, *levels: LogLevel | str | int) -> LevelSpec:
+        """
+        Log all levels except the given ones.
+        :param levels: the levels not to log
+        :return: the level filter
+        """
+        return cls("exclude", levels)
+
+
+def _levels_from(spec) -> set:
+    """
+    Convert a single level or an iterable of levels to a set of LogLevels.
+    :param spec: a level or an iterable of levels
+    :return: the set of levels, empty if spec is neither
+    """
+    if isinstance(spec, (str, int, LogLevel)):
+        return {_coerce_level(spec)}
+    if type(spec) in _ITER_TYPES or isinstance(spec, Iterable):
+        return {_coerce_level(level) for level in spec}
+    return set()
+
+
+# Level sets shared by all channels configured with the same levels
+_interned_level_sets = {}
+
+
+def _intern_levels(levels) -> frozenset:
+    """
+    Get the shared frozenset with the given levels.
+    :param levels: the levels
+    :return: the frozenset shared by all channels logging these levels
+    """
+    levels = frozenset(levels)
+    return _interned_level_sets.setdefault(levels, levels)
+
+
+def _build_loggable_set(spec, mode: str = "auto") -> frozenset:
+    """
+    Build the set of loggable levels from a level filter specification.
+
+    :param spec: the level filter specification
+    :param mode: how spec is interpreted:
+                 - "exclude": all levels except the given level(s)
+                 - "include": only the given level(s)
+                 - "threshold": all levels at or above the given level, or all levels except the ones listed in an
+                   {"exclude": [...]} dict
+                 - "auto": like "threshold", but an iterable of levels is used as in "include" mode
+    :return: the shared frozenset of loggable levels
+    """
+    if type(spec) is LevelSpec:
+        return _build_loggable_set(spec.levels[0] if spec.kind == "threshold" else spec.levels, spec.kind)
+    if mode == "exclude":
+        return _intern_levels(_ALL_LEVELS - _levels_from(spec))
+    if mode == "include":
+        return _intern_levels(_levels_from(spec))
+
+    # Check for exclusion mode (dict with "exclude" key)
+    if isinstance(spec, dict) and "exclude" in spec:
+        return _intern_levels(_ALL_LEVELS - {_coerce_level(level) for level in spec["exclude"]})
+
+    # Check for inclusion mode (iterable but not string or dict)
+    if mode == "auto" and (type(spec) in _ITER_TYPES or (not isinstance(spec, dict) and hasattr(spec, "__iter__")
+                                                         and not isinstance(spec, str))):
+        try:
+            return _intern_levels({_coerce_level(level) for level in spec})
+        except (TypeError, ValueError):
+            pass  # Fall through to threshold mode
+
+    # Threshold mode (single level)
+    threshold_level = _coerce_level(spec)
+    if not isinstance(threshold_level, LogLevel):
+        # Fallback: log all levels
+        threshold_level = LogLevel.NOTSET
+    return _levels_at_or_above(threshold_level, tuple(LogLevel.custom_levels))
+
 
 class OutputFormat(ExtendedEnum):
     """Output format for log messages."""
@@ -53,12 +268,77 @@ class LogField(ExtendedEnum):
     MESSAGE = "message"
 
 
+# Field order of new channels, copied per channel as it can be changed per channel
+_DEFAULT_FIELD_ORDER = tuple(field.value for field in (LogField.TIMESTAMP, LogField.PID, LogField.TID,
+                                                       LogField.FILE, LogField.LEVEL, LogField.MESSAGE))
+
+# Output formats by upper and lower case name
+_OUTPUT_FORMAT_BY_NAME = {**OutputFormat.__members__,
+                          **{name.lower(): output_format for name, output_format in OutputFormat.__members__.items()}}
+
+
+def _output_format_by_name(name: str) -> OutputFormat:
+    """
+    Get the output format with the given name, ignoring case.
+    :param name: the output format name
+    :return: the OutputFormat
+    :raises KeyError: no output format has this name
+    """
+    output_format = _OUTPUT_FORMAT_BY_NAME.get(name)
+    return output_format if output_format is not None else OutputFormat[name.upper()]
+
+
+# Set by use_orjson(), JSON records are serialized with the standard library unless this is opted in to
+_use_orjson = False
+
+
+def use_orjson(enabled: bool = True) -> bool:
+    """
+    Opt in to serializing JSON output with orjson, which is several times faster than the standard library.
+
+    The orjson layout differs from the default one: JSON_PRETTY is indented by 2 instead of 4 spaces, JSON_LINES
+    has no spaces after separators, non-ASCII text is not escaped and NaN or infinite floats are written as null.
+    :param enabled: True to serialize with orjson, False to return to the standard library
+    :return: True if orjson is used from now on, False if it is disabled or not installed
+    """
+    global _use_orjson
+    _use_orjson = enabled and orjson is not None
+    return _use_orjson
+
+
+def _dumps_record(data: dict, pretty: bool) -> str:
+    """
+    Serialize the fields of a structured log record, with orjson if use_orjson() opted in to it.
+
+    Values JSON has no type for, such as datetimes and enum members, are written as str(value) by both serializers.
+    :param data: the record fields
+    :param pretty: True for indented JSON, False for a single line
+    :return: the JSON string
+    """
+    if _use_orjson:
+        if any(isinstance(value, Enum) for value in data.values()):
+            # orjson writes enum members as their values, which for log levels are meaningless numbers
+            data = {key: str(value) if isinstance(value, Enum) else value for key, value in data.items()}
+        try:
+            return orjson.dumps(data, default=str,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                                (orjson.OPT_INDENT_2 if pretty else 0)).decode()
+        except TypeError:  # values orjson rejects, such as integers wider than 64 bit
+            if pretty:
+                return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+            return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    return json.dumps(data, indent=4 if pretty else None, default=str)
+
+
 class LogChannelABC(ABC):
     """Abstract base class for log channels.
 
     Provides a singleton logger instance that can be shared across log channels
     that need centralized logging infrastructure.
     """
+    # The base state lives in slots; subclasses without __slots__ of their own keep a __dict__ for theirs
+    __slots__ = ("__loggable_levels", "field_order", "output_format")
+
     _shared_logger: logging.Logger | None = None
 
     @classmethod
@@ -91,7 +371,7 @@ class LogChannelABC(ABC):
                 logger.removeHandler(handler)
 
             handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter(format_str))
+            handler.setFormatter(_formatter_for(format_str))
             logger.addHandler(handler)
             logger.propagate = False  # Prevent duplicate output
 
@@ -101,15 +381,10 @@ class LogChannelABC(ABC):
         :param minimum_log_level: minimum log level threshold
         :param include_log_levels: specific levels to exclude
         """
-        self.__loggable_levels = set()  # Set of all loggable LogLevel objects for this channel
-        self.field_order = [
-            LogField.TIMESTAMP.value,
-            LogField.PID.value,
-            LogField.TID.value,
-            LogField.FILE.value,
-            LogField.LEVEL.value,
-            LogField.MESSAGE.value
-        ]
+        # All loggable LogLevel objects for this channel: a frozenset shared with other channels until
+        # log_levels hands out a mutable copy
+        self.__loggable_levels = _ALL_LEVELS
+        self.field_order = list(_DEFAULT_FIELD_ORDER)
         self.output_format = OutputFormat.HUMAN_READABLE  # Output format for log messages
         self._configure_levels(minimum_log_level, include_log_levels, exclude_log_levels)
 
@@ -119,15 +394,23 @@ class LogChannelABC(ABC):
         Get the process ID.
         :return: the process ID
         """
-        return os.getpid()
+        return _pid
 
     @property
     def thread_id(self) -> int:
         """
-        Get the thread ID.
+        Get the thread ID of the thread that issued the record.
         :return: the thread ID
         """
-        return threading.get_ident()
+        return getattr(_issuing_thread, "ident", None) or threading.get_ident()
+
+    @property
+    def needs_call_site(self) -> bool:
+        """
+        Check whether the output of this channel contains the call site (file and line).
+        :return: True if the logger has to inspect the stack to find the call site for this channel
+        """
+        return True
 
     @property
     def log_levels(self):
@@ -135,6 +418,9 @@ class LogChannelABC(ABC):
         Get the current log level filter.
         :return: set of loggable levels
         """
+        if type(self.__loggable_levels) is frozenset:
+            # Copy on first access, as the caller may change the returned set
+            self.__loggable_levels = set(self.__loggable_levels)
         return self.__loggable_levels
 
     @log_levels.setter
@@ -151,126 +437,24 @@ class LogChannelABC(ABC):
         3. Dict with "exclude" key (exclusion mode): log all levels except specified ones
            Example: {"exclude": [LogLevel.DEBUG, LogLevel.INFO]}
 
+        A LevelSpec states the mode explicitly, e.g. LevelSpec.exclude(LogLevel.DEBUG).
+
         Internally stores all loggable levels in a set for O(1) lookup.
         """
-        # Check for exclusion mode (dict with "exclude" key)
-        if isinstance(log_level, dict) and "exclude" in log_level:
-            excluded_levels = set()
-            for level in log_level["exclude"]:
-                if isinstance(level, str):
-                    excluded_levels.add(LogLevel[level.upper()])
-                elif isinstance(level, int):
-                    excluded_levels.add(LogLevel.custom_level(level))
-                else:
-                    excluded_levels.add(level)
-
-            # Add all LogLevel members except the excluded ones
-            self.__loggable_levels = set(LogLevel) - excluded_levels
-            return
-
-        # Check for inclusion mode (iterable but not string or dict)
-        if not isinstance(log_level, dict) and hasattr(log_level, "__iter__") and not isinstance(log_level, str):
-            try:
-                loggable_levels = set()
-                for level in log_level:
-                    if isinstance(level, str):
-                        loggable_levels.add(LogLevel[level.upper()])
-                    elif isinstance(level, int):
-                        loggable_levels.add(LogLevel.custom_level(level))
-                    else:
-                        loggable_levels.add(level)
-                self.__loggable_levels = loggable_levels
-                return
-            except (TypeError, ValueError):
-                pass  # Fall through to threshold mode
-
-        # Default to threshold mode (single level)
-        if isinstance(log_level, str):
-            threshold_level = LogLevel[log_level.upper()]
-        elif isinstance(log_level, int):
-            threshold_level = LogLevel.custom_level(log_level)
-        elif isinstance(log_level, LogLevel):
-            threshold_level = log_level
-        else:
-            # Fallback: log all levels
-            threshold_level = LogLevel.NOTSET
-
-        # Build set of all levels >= threshold
-        self.__loggable_levels = {level for level in LogLevel
-                                  if level.logging_level() >= threshold_level.logging_level()}
+        self.__loggable_levels = _build_loggable_set(log_level)
 
     def _configure_levels(self, minimum_log_level, include_log_levels, exclude_log_levels):
         """Configure the loggable levels based on the provided parameters."""
         # Priority: exclude > include > minimum
         if exclude_log_levels is not None:
-            # Exclusion mode
-            if isinstance(exclude_log_levels, str):
-                excluded_levels = {LogLevel[exclude_log_levels.upper()]}
-            elif isinstance(exclude_log_levels, int):
-                excluded_levels = {LogLevel.custom_level(exclude_log_levels)}
-            elif isinstance(exclude_log_levels, LogLevel):
-                excluded_levels = {exclude_log_levels}
-            elif isinstance(exclude_log_levels, Iterable) and not isinstance(exclude_log_levels, str):
-                excluded_levels = set()
-                for level in exclude_log_levels:
-                    if isinstance(level, str):
-                        excluded_levels.add(LogLevel[level.upper()])
-                    elif isinstance(level, int):
-                        excluded_levels.add(LogLevel.custom_level(level))
-                    else:
-                        excluded_levels.add(level)
-            else:
-                excluded_levels = set()
-            self.__loggable_levels = set(LogLevel) - excluded_levels
-
+            self.__loggable_levels = _build_loggable_set(exclude_log_levels, "exclude")
         elif include_log_levels is not None:
-            # Inclusion mode
-            if isinstance(include_log_levels, str):
-                self.__loggable_levels = {LogLevel[include_log_levels.upper()]}
-            elif isinstance(include_log_levels, int):
-                self.__loggable_levels = {LogLevel.custom_level(include_log_levels)}
-            elif isinstance(include_log_levels, LogLevel):
-                self.__loggable_levels = {include_log_levels}
-            elif isinstance(include_log_levels, Iterable) and not isinstance(include_log_levels, str):
-                self.__loggable_levels = set()
-                for level in include_log_levels:
-                    if isinstance(level, str):
-                        self.__loggable_levels.add(LogLevel[level.upper()])
-                    elif isinstance(level, int):
-                        self.__loggable_levels.add(LogLevel.custom_level(level))
-                    else:
-                        self.__loggable_levels.add(level)
-            else:
-                self.__loggable_levels = set()
-
+            self.__loggable_levels = _build_loggable_set(include_log_levels, "include")
         elif minimum_log_level is not None:
-            # Check for exclusion mode (dict with "exclude" key)
-            if isinstance(minimum_log_level, dict) and "exclude" in minimum_log_level:
-                excluded_levels = set()
-                for level in minimum_log_level["exclude"]:
-                    if isinstance(level, str):
-                        excluded_levels.add(LogLevel[level.upper()])
-                    elif isinstance(level, int):
-                        excluded_levels.add(LogLevel.custom_level(level))
-                    else:
-                        excluded_levels.add(level)
-                self.__loggable_levels = set(LogLevel) - excluded_levels
-            else:
-                # Minimum level mode (threshold)
-                if isinstance(minimum_log_level, str):
-                    threshold_level = LogLevel[minimum_log_level.upper()]
-                elif isinstance(minimum_log_level, int):
-                    threshold_level = LogLevel.custom_level(minimum_log_level)
-                elif isinstance(minimum_log_level, LogLevel):
-                    threshold_level = minimum_log_level
-                else:
-                    threshold_level = LogLevel.NOTSET
-
-                self.__loggable_levels = {level for level in LogLevel
-                                          if level.logging_level() >= threshold_level.logging_level()}
+            self.__loggable_levels = _build_loggable_set(minimum_log_level, "threshold")
         else:
             # Default: log everything
-            self.__loggable_levels = set(LogLevel)
+            self.__loggable_levels = _ALL_LEVELS
 
     def is_loggable(self, log_level: LogLevel | str | int) -> bool:
         """
@@ -278,14 +462,12 @@ class LogChannelABC(ABC):
         :param log_level: the log level to check
         :return: True if loggable, False otherwise
         """
-        # Convert to LogLevel object
-        if isinstance(log_level, str):
-            log_level = LogLevel[log_level.upper()]
-        elif isinstance(log_level, int):
-            log_level = LogLevel.custom_level(log_level)
+        # Fast path: FlashLogger resolves names and numbers before asking the channels
+        if type(log_level) is LogLevel:
+            return log_level in self.__loggable_levels
 
         # Just check membership in the loggable levels set
-        return log_level in self.__loggable_levels
+        return _coerce_level(log_level) in self.__loggable_levels
 
     def set_output_format(self, output_format: OutputFormat | str):
         """
@@ -294,12 +476,17 @@ class LogChannelABC(ABC):
         :param output_format: OutputFormat enum or string equivalent
         """
         if isinstance(output_format, str):
-            output_format = OutputFormat[output_format.upper()]
+            output_format = _output_format_by_name(output_format)
         elif not isinstance(output_format, OutputFormat):
             raise ValueError(f"Invalid output_format type: {type(output_format)}. Expected OutputFormat or str.")
 
         self.output_format = output_format
 
+    def flush(self) -> None:
+        """
+        Write log entries the channel has buffered. Channels without a buffer do nothing.
+        """
+
     @abstractmethod
     def do_log(self, log_level: LogLevel | str | int, *args, **kwargs):
         """
@@ -23,11 +23,16 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
-import json
 import os
+import queue
+import threading
+import time
 import logging
+from itertools import islice
 from logging import LogRecord
+from operator import itemgetter
 from pathlib import Path
 
 from colorama import Style, Fore, Back
@@ -43,12 +48,43 @@ except Exception:
         return decorator
 
 
-from flashlogger.color_scheme import ColorScheme
-from flashlogger.log_channel_abc import LogChannelABC, OutputFormat
+from flashlogger.color_scheme import ColorScheme, Field, _BACK_MAP, _FORE_MAP
+from flashlogger.log_channel_abc import (LogChannelABC, LogField, OutputFormat, _DEFAULT_FIELD_ORDER, _coerce_level,
+                                         _dumps_record, _issuing_thread, _output_format_by_name, _record_level)
 from flashlogger.log_levels import LogLevel
 
 DEFAULT_FORMAT = "[%(asctime)s]\t[%(levelname)s] %(message)s"
 
+# Bound once so formatting a record's file name is a single global lookup
+_basename = os.path.basename
+
+# Standard LogRecord attributes and our file/line additions, not copied into the JSON output as keyword arguments
+_STANDARD_RECORD_ATTRS = frozenset({'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+                                    'filename', 'module', 'exc_text', 'exc_info', 'stack_info',
+                                    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+                                    'thread', 'threadName', 'processName', 'process', 'message',
+                                    'asctime', 'taskName', 'file', 'line'})
+
+# Fields whose color prefix ConsoleFormatter binds when its color scheme is set
+_PREFIX_FIELDS = (Field.OPERATOR, Field.TIMESTAMP, Field.PID, Field.TID, Field.FILE, Field.MESSAGE)
+
+# JSON keys of the first positional message args, longer argument lists format the further keys per record
+_MESSAGE_KEYS = tuple(f"message{i}" for i in range(32))
+
+# Fields _get_field_tags builds a tag for
+_TAG_FIELDS = frozenset(_DEFAULT_FIELD_ORDER)
+
+# Levels ConsoleFormatter writes without field tags
+_COMMAND_LEVELS = frozenset((LogLevel.COMMAND, LogLevel.COMMAND_OUTPUT, LogLevel.COMMAND_STDERR))
+
+# Operator and comment colors of command records, independent of the color scheme
+_COMMENT_FG = Fore.LIGHTBLACK_EX
+_LEFT_ROUND_BRACE = Fore.YELLOW + "(" + Style.RESET_ALL
+_RIGHT_ROUND_BRACE = Fore.YELLOW + ")" + Style.RESET_ALL
+
+# Most records the writer thread of an asynchronous console channel writes with one write call
+_MAX_BATCH_SIZE = 128
+
 
 class ConsoleFormatter(logging.Formatter):
     """
@@ -57,41 +93,71 @@ class ConsoleFormatter(logging.Formatter):
 
     def __init__(self, fmt=DEFAULT_FORMAT, color_scheme=None, field_order=None, output_format=None, channel=None):
         logging.Formatter.__init__(self, fmt=fmt)
-        self.color_scheme = color_scheme if color_scheme is not None else ColorScheme()
-        self.field_order = field_order if field_order is not None else ["timestamp", "pid", "tid", "file", "level", "message"]
+        self.color_scheme = color_scheme if color_scheme is not None else ColorScheme.shared().copy()
+        self.field_order = field_order if field_order is not None else list(_DEFAULT_FIELD_ORDER)
         self.output_format = output_format if output_format is not None else OutputFormat.HUMAN_READABLE
         self.channel = channel
+        self._second_cache = (None, "")
+        self._field_getter = (None, None)
 
-    def _get_field_tags(self, record, level_color, level_name, timestamp, pid, tid, message, file=None, line=None):
-        """Get field tags dict based on field_order."""
-        # Use the new ColorScheme.get() method for field colors
-        timestamp_color = self.color_scheme.get("timestamp")
-        pid_color = self.color_scheme.get("pid")
-        tid_color = self.color_scheme.get("tid")
-        bracket_color = self.color_scheme.get("operator")
+    @property
+    def color_scheme(self) -> ColorScheme:
+        """
+        Get the color scheme used by this formatter.
+        :return: the color scheme
+        """
+        return self._color_scheme
 
-        left_square_brace = bracket_color + "[" + Style.RESET_ALL
-        right_square_brace = bracket_color + "]" + Style.RESET_ALL
+    @color_scheme.setter
+    def color_scheme(self, color_scheme: ColorScheme) -> None:
+        """
+        Set the color scheme and bind the field prefixes used for every record.
+        :param color_scheme: the new color scheme
+        """
+        self._color_scheme = color_scheme
+        self._bind_field_tags()
+
+    def _bind_field_tags(self) -> None:
+        """
+        Bind the field colors and the bracket fragments around each field tag to the current color scheme,
+        so records only concatenate them with their values.
+        """
+        self._scheme_version = self._color_scheme.version
+        self._field_prefixes = {field: self._color_scheme.prefix_for(field) for field in _PREFIX_FIELDS}
+        bracket_color = self._field_prefixes[Field.OPERATOR]
+        self._tag_open = bracket_color + "[" + Style.RESET_ALL
+        self._tag_close = Style.RESET_ALL + bracket_color + "]" + Style.RESET_ALL
+        self._field_tag_open = {field: self._tag_open + self._field_prefixes[field]
+                                for field in _PREFIX_FIELDS if field != Field.OPERATOR}
+        # Bright level tag openings, filled per level as records arrive
+        self._level_tag_open = {}
+
+    def _get_field_tags(self, record, level_tag_open, level_name, timestamp, pid, tid, message, file=None, line=None):
+        """Get field tags dict based on field_order."""
+        # Tag fragments bound when the color scheme was set
+        field_tag_open = self._field_tag_open
+        tag_close = self._tag_close
 
         # Format file information
         file_info = "unknown"
         if file and line:
             # Get just the filename without path
-            filename = os.path.basename(file) if file != "<stdin>" else file
+            filename = _basename(file) if file != "<stdin>" else file
             file_info = f"{filename}:{line}"
         elif file:
-            filename = os.path.basename(file) if file != "<stdin>" else file
+            filename = _basename(file) if file != "<stdin>" else file
             file_info = filename
         elif line:
             file_info = f"line:{line}"
 
+        # One f-string per tag builds it without intermediate strings
         tags = {
-            "timestamp": left_square_brace + timestamp_color + timestamp + Style.RESET_ALL + right_square_brace,
-            "pid": left_square_brace + pid_color + f"pid:{pid}" + Style.RESET_ALL + right_square_brace,
-            "tid": left_square_brace + tid_color + f"tid:{tid}" + Style.RESET_ALL + right_square_brace,
-            "file": left_square_brace + self.color_scheme.get("file") + file_info + Style.RESET_ALL + right_square_brace,
-            "level": left_square_brace + level_color + level_name + Style.RESET_ALL + right_square_brace,
-            "message": left_square_brace + self.color_scheme.get("message") + message + Style.RESET_ALL + right_square_brace,
+            "timestamp": f"{field_tag_open[Field.TIMESTAMP]}{timestamp}{tag_close}",
+            "pid": f"{field_tag_open[Field.PID]}pid:{pid}{tag_close}",
+            "tid": f"{field_tag_open[Field.TID]}tid:{tid}{tag_close}",
+            "file": f"{field_tag_open[Field.FILE]}{file_info}{tag_close}",
+            "level": f"{level_tag_open}{level_name}{tag_close}",
+            "message": f"{field_tag_open[Field.MESSAGE]}{message}{tag_close}",
         }
         return tags
 
@@ -106,21 +172,18 @@ class ConsoleFormatter(logging.Formatter):
         :param foreground: color name (e.g., "RED", "GREEN")
         :param background: color name (e.g., "BLACK", "WHITE")
         """
-        if isinstance(log_level, str):
-            log_level = LogLevel[log_level.upper()]
-        elif isinstance(log_level, int):
-            log_level = LogLevel.custom_level(log_level)
+        log_level = _coerce_level(log_level)
 
-        level_str = log_level.name.lower()
-
-        # Convert color names to ANSI codes and set attributes
+        # Convert color names to ANSI codes and set them on the color scheme
+        colors = {}
         if foreground is not None:
-            fg = getattr(Fore, foreground.upper(), Fore.WHITE)
-            setattr(self.color_scheme, f"{level_str}_foreground", fg)
+            colors["foreground"] = _FORE_MAP.get(foreground.upper(), Fore.WHITE)
 
         if background is not None:
-            bg = getattr(Back, background.upper(), Back.BLACK)
-            setattr(self.color_scheme, f"{level_str}_background", bg)
+            colors["background"] = _BACK_MAP.get(background.upper(), Back.BLACK)
+
+        self.color_scheme.set_colors(log_level, **colors)
+        self._bind_field_tags()
 
     def _format_args_for_json(self, record: LogRecord) -> dict:
         """
@@ -137,13 +200,7 @@ class ConsoleFormatter(logging.Formatter):
         """
         # Get standard fields
         timestamp = self.formatTime(record)
-        log_level = LogLevel.custom_level(record.levelno)
-        level_name = str(log_level).lower()
-        if record.levelno in {LogLevel.ERROR.logging_level(),
-                              LogLevel.WARNING.logging_level(),
-                              LogLevel.FATAL.logging_level(),
-                              LogLevel.CRITICAL.logging_level()}:
-            level_name = level_name.upper()
+        log_level, level_name = _record_level(record.levelno)
 
         data = {
             "timestamp": timestamp,
@@ -157,16 +214,16 @@ class ConsoleFormatter(logging.Formatter):
         if isinstance(main_message, dict):
             # Main message is a dict - merge directly into data
             data.update(main_message)
-            # Add remaining args if any
-            for i, arg in enumerate(record.args):
-                key = f"message{i}"
-                data[key] = arg
         else:
-            # Regular case - add message and positional args
+            # Regular case - add message
             data["message"] = main_message
-            for i, arg in enumerate(record.args):
-                key = f"message{i}"
-                data[key] = arg
+
+        # Add positional args as message0, message1, ...
+        args = record.args
+        data.update(zip(_MESSAGE_KEYS, args))
+        if len(args) > len(_MESSAGE_KEYS):
+            for i, arg in enumerate(islice(args, len(_MESSAGE_KEYS), None), len(_MESSAGE_KEYS)):
+                data[f"message{i}"] = arg
 
         # Add file/line info if available
         file_info = getattr(record, 'file', None)
@@ -176,14 +233,14 @@ class ConsoleFormatter(logging.Formatter):
         if line_info:
             data["line"] = line_info
 
-        # Add any keyword arguments that were stored in record.__dict__
-        for key, value in record.__dict__.items():
-            if key not in {'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'exc_text', 'exc_info', 'stack_info',
-                          'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                          'thread', 'threadName', 'processName', 'process', 'message',
-                          'asctime', 'file', 'line'}:  # Standard LogRecord attributes + our additions
-                data[key] = value
+        # Add any keyword arguments that were stored in record.__dict__, found by a set difference in C.
+        # Most records have none; the others are copied in record.__dict__ order, as a set has no order.
+        record_attrs = record.__dict__
+        extra_keys = record_attrs.keys() - _STANDARD_RECORD_ATTRS
+        if extra_keys:
+            for key, value in record_attrs.items():
+                if key in extra_keys:
+                    data[key] = value
 
         return data
 
@@ -194,32 +251,10 @@ class ConsoleFormatter(logging.Formatter):
         :param record: the logging record.
         :return: the formatted record as string.
         """
-        # Safely get message - if formatting fails, use the raw msg
-        try:
-            message = record.getMessage()
-        except (TypeError, ValueError):
-            message = record.msg  # Use raw message without formatting
-        timestamp = self.formatTime(record)
-        log_level = LogLevel.custom_level(record.levelno)
-        level_name = str(log_level).lower()
-        if record.levelno in {LogLevel.ERROR.logging_level(),
-                              LogLevel.WARNING.logging_level(),
-                              LogLevel.FATAL.logging_level(),
-                              LogLevel.CRITICAL.logging_level()}:
-            level_name = level_name.upper()
-        process_id = self.channel.process_id if self.channel else record.process
-        thread_id = self.channel.thread_id if self.channel else record.thread
-
-        data = {
-            "timestamp": timestamp,
-            "level": level_name,
-            "message": message,
-            "pid": process_id,
-            "tid": thread_id
-        }
+        log_level, level_name = _record_level(record.levelno)
 
         if self.output_format != OutputFormat.HUMAN_READABLE:
-            # Use the complete structured format for JSON output
+            # Use the complete structured format for JSON output, which collects its own fields
             data = self._format_args_for_json(record)
             # Add command types if applicable
             if log_level == LogLevel.COMMAND:
@@ -228,39 +263,63 @@ class ConsoleFormatter(logging.Formatter):
                 data["type"] = "stdout"
             elif log_level == LogLevel.COMMAND_STDERR:
                 data["type"] = "stderr"
-            indent = 4 if self.output_format == OutputFormat.JSON_PRETTY else None
-            return json.dumps(data, indent=indent, default=str)
+            return _dumps_record(data, self.output_format == OutputFormat.JSON_PRETTY)
 
         # Human-readable
-        operator_fg = Fore.YELLOW  # Use yellow for operators
-        comment_fg = Fore.LIGHTBLACK_EX  # Use light black for comments
-        left_round_brace = operator_fg + "(" + Style.RESET_ALL
-        right_round_brace = operator_fg + ")" + Style.RESET_ALL
-        # Use ColorScheme.get() for log level colors
-        log_level_str = str(LogLevel.custom_level(record.levelno)).lower()
-        normal_color = self.color_scheme.get(log_level_str)
-        highlight_color = self.color_scheme.get(log_level_str, style=Style.BRIGHT)  # Highlight with bright style
-
-        if log_level == LogLevel.COMMAND:
-            message_tag = normal_color + message + Style.RESET_ALL
-            comment_tag = comment_fg + f" ## command executed at {timestamp}" + Style.RESET_ALL
-            return f"{message_tag}{comment_tag}"
-
-        if log_level == LogLevel.COMMAND_OUTPUT:
-            std_tag = left_round_brace + highlight_color + "stdout" + right_round_brace + ": " + Style.RESET_ALL
-            message_tag = self.color_scheme.get("message") + message + Style.RESET_ALL
-            return f"{std_tag}{message_tag}"
-
-        if log_level == LogLevel.COMMAND_STDERR:
-            std_tag = left_round_brace + highlight_color + "stderr" + right_round_brace + ": " + Style.RESET_ALL
-            message_tag = self.color_scheme.get("message") + message + Style.RESET_ALL
-            return f"{std_tag}{message_tag}"
+        # Safely get message - if formatting fails, use the raw msg
+        try:
+            message = record.getMessage()
+        except (TypeError, ValueError):
+            message = record.msg  # Use raw message without formatting
+        timestamp = self.formatTime(record)
+        if self._scheme_version != self._color_scheme.version:
+            # Colors were changed on the scheme itself since the tags were bound
+            self._bind_field_tags()
+
+        if log_level in _COMMAND_LEVELS:
+            if log_level == LogLevel.COMMAND:
+                message_tag = self.color_scheme.colorize(log_level, message)
+                return f"{message_tag}{_COMMENT_FG} ## command executed at {timestamp}{Style.RESET_ALL}"
+
+            # Cached log level prefix; keyed by the member so relabelled custom levels keep their colors
+            highlight_color = self.color_scheme.prefix_for(log_level, style=Style.BRIGHT)
+            stream_name = "stdout" if log_level == LogLevel.COMMAND_OUTPUT else "stderr"
+            return (f"{_LEFT_ROUND_BRACE}{highlight_color}{stream_name}{_RIGHT_ROUND_BRACE}: {Style.RESET_ALL}"
+                    f"{self._field_prefixes[Field.MESSAGE]}{message}{Style.RESET_ALL}")
+
+        process_id = self.channel.process_id if self.channel else record.process
+        thread_id = self.channel.thread_id if self.channel else record.thread
 
         # Regular log - get file and line from record's __dict__ if available
         file_info = getattr(record, 'file', None)
         line_info = getattr(record, 'line', None)
-        tags = self._get_field_tags(record, highlight_color, level_name, timestamp, process_id, thread_id, message, file=file_info, line=line_info)
-        return " ".join([tags[field] for field in self.field_order if field in tags])
+        level_tag_open = self._level_tag_open.get(log_level)
+        if level_tag_open is None:
+            # Keyed by the member so relabelled custom levels keep their colors
+            level_tag_open = self._tag_open + self.color_scheme.prefix_for(log_level, style=Style.BRIGHT)
+            self._level_tag_open[log_level] = level_tag_open
+        tags = self._get_field_tags(record, level_tag_open, level_name, timestamp, process_id, thread_id, message, file=file_info, line=line_info)
+        field_order, get_fields = self._field_getter
+        if field_order != self.field_order:
+            get_fields = self._bind_field_getter()
+        return " ".join(get_fields(tags))
+
+    def _bind_field_getter(self):
+        """
+        Bind the getter of the tags to output, in field order, to a snapshot of the current field order.
+
+        The field order is compared with the snapshot for every record, as it can also be changed in place.
+        :return: the getter
+        """
+        fields = tuple(field for field in self.field_order if field in _TAG_FIELDS)
+        if len(fields) > 1:
+            get_fields = itemgetter(*fields)
+        else:
+            # itemgetter() needs a field and returns a single field unwrapped
+            def get_fields(tags, fields=fields):
+                return [tags[field] for field in fields]
+        self._field_getter = (self.field_order[:], get_fields)
+        return get_fields
 
     @overrides(logging.Formatter)
     def formatTime(self, record, datefmt=None) -> str:
@@ -270,61 +329,207 @@ class ConsoleFormatter(logging.Formatter):
         :param: date_fmt:  the format string for dates and timestamps.
         :return: the formatted timestamp as string.
         """
-        ct = datetime.datetime.fromtimestamp(record.created)
         if datefmt is not None:
-            s = ct.strftime(datefmt)
-        else:
-            t = ct.strftime("%Y-%m-%d %H:%M:%S")
-            s = f"{t}.{int(record.msecs):05d}"
-        return s
+            return datetime.datetime.fromtimestamp(record.created).strftime(datefmt)
+        # Records arrive in bursts within the same second, so only the sub-second part changes between most calls.
+        # The second and its formatted string are swapped as one tuple, so concurrent callers never mix them up.
+        second = int(record.created)
+        cached_second, second_str = self._second_cache
+        if second != cached_second:
+            second_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._second_cache = (second, second_str)
+        return f"{second_str}.{int(record.msecs):05d}"
+
+
+class _AsyncBatchHandler(logging.StreamHandler):
+    """
+    A stream handler which leaves formatting and writing to a background thread.
+
+    Logging threads only enqueue their records, so they never wait for the stream. The writer thread formats the
+    records available and writes them with a single write and flush. flush() waits until the records enqueued before
+    it have been written, logging calls it at interpreter exit; close() also stops the writer thread.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._records = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_batches, name="flashlogger-console-writer", daemon=True)
+        self._writer.start()
+
+    @overrides(logging.StreamHandler)
+    def emit(self, record: LogRecord) -> None:
+        """
+        Enqueue the record for the writer thread.
+
+        Like QueueHandler.prepare(), human-readable records are enqueued with their message merged with its
+        arguments, so arguments changed after the logging call do not change the output. JSON output writes the
+        message and its arguments as separate fields, so those records are enqueued unchanged.
+        :param record: the logging record
+        """
+        if record.args and getattr(self.formatter, "output_format", None) == OutputFormat.HUMAN_READABLE:
+            try:
+                message = record.getMessage()
+            except (TypeError, ValueError):
+                pass  # the formatter falls back to the raw message as well
+            else:
+                # Other handlers of the logger get the same record, so merge into a copy
+                record = copy.copy(record)
+                record.msg = message
+                record.args = ()
+        # The formatter runs in the writer thread, so remember the thread which issued the record
+        self._records.put_nowait((getattr(_issuing_thread, "ident", None) or threading.get_ident(), record))
+
+    @overrides(logging.StreamHandler)
+    def flush(self) -> None:
+        """
+        Wait until the writer thread has written all records enqueued so far.
+        """
+        if not self._writer.is_alive() or threading.current_thread() is self._writer:
+            return
+        written = threading.Event()
+        self._records.put_nowait((None, written))
+        written.wait()
+
+    @overrides(logging.StreamHandler)
+    def close(self) -> None:
+        """
+        Write the enqueued records and stop the writer thread, then close the handler.
+        """
+        if self._writer.is_alive() and threading.current_thread() is not self._writer:
+            # The stop request is queued behind the records enqueued so far, which are written first
+            self._records.put_nowait((None, None))
+            self._writer.join()
+        super().close()
+
+    def _write_batches(self) -> None:
+        """Format and write the enqueued records in batches until close() stops it, runs in the writer thread."""
+        records = self._records
+        # Reused for every batch, cleared in place once it is written
+        batch = []
+        lines = []
+        flush_events = []
+        stopped = False
+        while not stopped:
+            batch.append(records.get())
+            while len(batch) < _MAX_BATCH_SIZE:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+
+            record = None
+            for thread_id, item in batch:
+                if thread_id is None:
+                    # A flush event, or None to stop once the records before it are written
+                    if item is None:
+                        stopped = True
+                    else:
+                        flush_events.append(item)
+                    continue
+                record = item
+                _issuing_thread.ident = thread_id
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            _issuing_thread.ident = None
+
+            if lines:
+                try:
+                    # The empty last line ends the batch with a terminator without copying the joined text
+                    lines.append("")
+                    self.stream.write(self.terminator.join(lines))
+                    self.stream.flush()
+                except Exception:
+                    self.handleError(record)
+            for written in flush_events:
+                written.set()
+            batch.clear()
+            lines.clear()
+            flush_events.clear()
 
 
 class LogChannelConsole(LogChannelABC):
     """
     A logging channel which writes log messages to console.
+
+    With asynchronous=True the console handler installed by the channel formats and writes the records in a
+    background thread, in batches. Channels sharing the shared logger use the handler of the first one.
     """
 
+    # Set once the legacy (non-shared) mode has attached its handler to the root logger
+    _handler_added: bool = False
+    _root_handler: logging.Handler | None = None
+
+    # Console handler of the shared logger, checked by identity instead of scanning the logger's handlers
+    _shared_handler: logging.Handler | None = None
+
     def __init__(self,
                  color_scheme: ColorScheme | ColorScheme.Default = None,
                  minimum_log_level=None,
                  include_log_levels=None,
                  exclude_log_levels=None,
                  use_shared_logger: bool = True,
-                 output_format: OutputFormat | str = None):
+                 output_format: OutputFormat | str = None,
+                 asynchronous: bool = False):
         super().__init__(minimum_log_level=minimum_log_level,
                          include_log_levels=include_log_levels,
                          exclude_log_levels=exclude_log_levels)
         if output_format is not None:
             if isinstance(output_format, str):
-                output_format = OutputFormat[output_format.upper()]
+                output_format = _output_format_by_name(output_format)
             self.output_format = output_format
         self.color_scheme = color_scheme if color_scheme and isinstance(color_scheme, ColorScheme) \
-            else ColorScheme(default_scheme=color_scheme)
+            else ColorScheme.shared(default_scheme=color_scheme).copy()
         self.use_shared_logger = use_shared_logger
 
         if use_shared_logger:
             # Use the shared logger from LogChannelABC
             self._logger = self.__class__.get_shared_logger()
             # Ensure shared logger has our formatter
-            if not any(isinstance(h, logging.StreamHandler) and
-                       isinstance(getattr(h, "formatter", None), ConsoleFormatter)
-                       for h in self._logger.handlers):
-                # Add our console formatter if not already present
-                handler = logging.StreamHandler()
-                handler.setFormatter(ConsoleFormatter(color_scheme=self.color_scheme,
-                                                      field_order=self.field_order,
-                                                      output_format=self.output_format,
-                                                      channel=self))
-                self._logger.addHandler(handler)
+            if LogChannelConsole._shared_handler not in self._logger.handlers:
+                handler = next((h for h in self._logger.handlers
+                                if isinstance(h, logging.StreamHandler) and
+                                isinstance(getattr(h, "formatter", None), ConsoleFormatter)), None)
+                if handler is None:
+                    # Add our console formatter if not already present
+                    handler = _AsyncBatchHandler() if asynchronous else logging.StreamHandler()
+                    handler.setFormatter(ConsoleFormatter(color_scheme=self.color_scheme,
+                                                          field_order=self.field_order,
+                                                          output_format=self.output_format,
+                                                          channel=self))
+                    self._logger.addHandler(handler)
+                LogChannelConsole._shared_handler = handler
+            # The formatter of the shared handler, which the setters update
+            self._formatter = LogChannelConsole._shared_handler.formatter
         else:
             # Create instance-specific logger (legacy behavior)
-            if not hasattr(LogChannelConsole, "_handler_added"):
-                handler = logging.StreamHandler()
+            if not LogChannelConsole._handler_added:
+                handler = _AsyncBatchHandler() if asynchronous else logging.StreamHandler()
                 handler.setFormatter(ConsoleFormatter(color_scheme=self.color_scheme))
                 logging.getLogger().addHandler(handler)
                 logging.getLogger().setLevel(logging.DEBUG)
                 LogChannelConsole._handler_added = True
+                LogChannelConsole._root_handler = handler
             self._logger = logging.getLogger()
+            root_handler = LogChannelConsole._root_handler
+            self._formatter = root_handler.formatter if root_handler is not None else None
+
+    @classmethod
+    def reset_handlers(cls) -> None:
+        """
+        Remove and close the console handlers installed by the channels, so the next channel installs new ones.
+
+        Meant for test teardown: existing channels keep their logger, but no longer write to the console.
+        """
+        for handler, logger in ((cls._shared_handler, cls.get_shared_logger()),
+                                (cls._root_handler, logging.getLogger())):
+            if handler is not None:
+                logger.removeHandler(handler)
+                handler.close()
+        LogChannelConsole._shared_handler = None
+        LogChannelConsole._root_handler = None
+        LogChannelConsole._handler_added = False
 
     def set_level_color(self, log_level: LogLevel | str | int,
                         foreground: str = None, background: str = None) -> None:
@@ -337,14 +542,7 @@ class LogChannelConsole(LogChannelABC):
         :param foreground: color name (e.g., "RED", "GREEN")
         :param background: color name (e.g., "BLACK", "WHITE")
         """
-        # Find our formatter in the logger handlers and call set_level_color on it
-        for handler in self._logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and isinstance(handler.formatter, ConsoleFormatter):
-                handler.formatter.set_level_color(log_level, foreground, background)
-                return
-
-        # If not using shared logger, try to find the formatter directly
-        if hasattr(self, '_formatter') and isinstance(self._formatter, ConsoleFormatter):
+        if self._formatter is not None:
             self._formatter.set_level_color(log_level, foreground, background)
 
     def set_color_scheme(self, color_scheme) -> None:
@@ -354,7 +552,7 @@ class LogChannelConsole(LogChannelABC):
         :param color_scheme: either a ColorScheme.Default enum or a path (str/Path) to a color scheme JSON file
         """
         if isinstance(color_scheme, ColorScheme.Default):
-            self.color_scheme = ColorScheme(default_scheme=color_scheme)
+            self.color_scheme = ColorScheme.shared(default_scheme=color_scheme).copy()
         elif isinstance(color_scheme, (str, Path)):
             self.color_scheme = ColorScheme(colorscheme_json=Path(color_scheme))
         elif isinstance(color_scheme, ColorScheme):
@@ -362,10 +560,21 @@ class LogChannelConsole(LogChannelABC):
         else:
             raise ValueError(f"Invalid color_scheme type: {type(color_scheme)}. Expected ColorScheme.Default, path, or ColorScheme instance.")
 
-        # Update the color_scheme in all ConsoleFormatters
-        for handler in self._logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and isinstance(handler.formatter, ConsoleFormatter):
-                handler.formatter.color_scheme = self.color_scheme
+        # Update the color_scheme in the ConsoleFormatter
+        if self._formatter is not None:
+            self._formatter.color_scheme = self.color_scheme
+
+    @property
+    def needs_call_site(self) -> bool:
+        """
+        Check whether the output of this channel contains the call site (file and line).
+
+        JSON output always contains it, human-readable output only if the file field is shown. Channels
+        writing through a shared handler render with its formatter, so its settings decide.
+        :return: True if the logger has to inspect the stack to find the call site for this channel
+        """
+        source = self._formatter if self._formatter is not None else self
+        return source.output_format != OutputFormat.HUMAN_READABLE or LogField.FILE.value in source.field_order
 
     def set_output_format(self, output_format: OutputFormat | str) -> None:
         """
@@ -376,10 +585,18 @@ class LogChannelConsole(LogChannelABC):
         # Call the parent method to update self.output_format
         super().set_output_format(output_format)
 
-        # Update the output_format in all ConsoleFormatters
+        # Update the output_format in the ConsoleFormatter
+        if self._formatter is not None:
+            self._formatter.output_format = self.output_format
+
+    @overrides(LogChannelABC)
+    def flush(self) -> None:
+        """
+        Wait until an asynchronous console handler has written the records enqueued so far.
+        """
         for handler in self._logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and isinstance(handler.formatter, ConsoleFormatter):
-                handler.formatter.output_format = self.output_format
+            if isinstance(handler, _AsyncBatchHandler):
+                handler.flush()
 
     @overrides(LogChannelABC)
     def do_log(self, log_level: LogLevel | str | int, *args, **kwargs) -> None:
@@ -388,25 +605,16 @@ class LogChannelConsole(LogChannelABC):
         :param log_level: the logging level
         :param kwargs: additional keyword arguments, including file and line info
         """
+        # Resolve names and numbers once, is_loggable() then takes its LogLevel fast path
+        log_level = _coerce_level(log_level)
         if not self.is_loggable(log_level):
             return
-        if isinstance(log_level, str):
-            log_level = LogLevel[log_level.upper()]
-        elif isinstance(log_level, int):
-            log_level = LogLevel.custom_level(log_level)
         # now log_level is LogLevel
+        level_int = log_level.logging_level()
+        if not self._logger.isEnabledFor(level_int):
+            # The logger would drop the record, don't build it
+            return
 
-        # Extract file and line info for the LogRecord
-        extra = {}
-        if 'file' in kwargs:
-            extra['file'] = kwargs['file']
-        if 'line' in kwargs:
-            extra['line'] = kwargs['line']
-
-        # Remove file/line from kwargs so they don't interfere with message formatting
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k not in ('file', 'line')}
-
-        # Add all remaining kwargs to extra dict (for JSON args and custom data)
-        extra.update(filtered_kwargs)
-
-        self._logger.log(log_level.logging_level(), args[0] if args else "", *args[1:], extra=extra)
+        # kwargs is a new dict for every call, so it is passed on as the extra attributes of the LogRecord:
+        # file and line info and all remaining kwargs (for JSON args and custom data)
+        self._logger.log(level_int, args[0] if args else "", *args[1:], extra=kwargs)
@@ -24,9 +24,9 @@
 from __future__ import annotations
 
 import datetime
-import json
 import logging
 import os
+import time
 from logging import LogRecord
 from pathlib import Path
 
@@ -41,11 +41,18 @@ except Exception:
         return decorator
 
 
-from flashlogger.log_channel_abc import LogChannelABC, OutputFormat
+from flashlogger.log_channel_abc import (LogChannelABC, OutputFormat, _coerce_level, _dumps_record,
+                                         _output_format_by_name, _record_level)
 from flashlogger.log_levels import LogLevel
 
+# Buffer size of the file channels FlashLogger creates for a log_file argument
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
 DEFAULT_FORMAT = '[%(asctime)s]\t[%(levelname)s] [%(threadname)s] %(message)s'
 
+# Bound once so formatting a record's file name is a single global lookup
+_basename = os.path.basename
+
 
 class FileLogFormatter(logging.Formatter):
     """
@@ -61,6 +68,7 @@ class FileLogFormatter(logging.Formatter):
         self.output_format = output_format if output_format is not None else OutputFormat.HUMAN_READABLE
         self.channel = channel
         self.custom_format = custom_format
+        self._second_cache = (None, "")
 
     @overrides(logging.Formatter)
     def format(self, record: LogRecord) -> str:
@@ -71,13 +79,7 @@ class FileLogFormatter(logging.Formatter):
         """
         message = record.getMessage()
         timestamp = self.formatTime(record)
-        log_level = LogLevel.custom_level(record.levelno)
-        level_name = str(log_level).lower()
-        if record.levelno in {LogLevel.ERROR.logging_level(),
-                              LogLevel.WARNING.logging_level(),
-                              LogLevel.FATAL.logging_level(),
-                              LogLevel.CRITICAL.logging_level()}:
-            level_name = level_name.upper()
+        log_level, level_name = _record_level(record.levelno)
         process_id = self.channel.process_id if self.channel else record.process
         thread_id = self.channel.thread_id if self.channel else record.thread
 
@@ -103,22 +105,21 @@ class FileLogFormatter(logging.Formatter):
             # Use the parent logging.Formatter.format with custom format string
             return super().format(record)
         elif self.output_format != OutputFormat.HUMAN_READABLE:
-            indent = 4 if self.output_format == OutputFormat.JSON_PRETTY else None
             if log_level == LogLevel.COMMAND:
                 data["type"] = "command"
             elif log_level == LogLevel.COMMAND_OUTPUT:
                 data["type"] = "stdout"
             elif log_level == LogLevel.COMMAND_STDERR:
                 data["type"] = "stderr"
-            return json.dumps(data, indent=indent, default=str)
+            return _dumps_record(data, self.output_format == OutputFormat.JSON_PRETTY)
 
         # Human-readable - include file:line info if available
         file_line_str = ""
         if file_info and line_info:
-            filename = os.path.basename(file_info) if file_info != "<stdin>" else file_info
+            filename = _basename(file_info) if file_info != "<stdin>" else file_info
             file_line_str = f" [{filename}:{line_info}]"
         elif file_info:
-            filename = os.path.basename(file_info) if file_info != "<stdin>" else file_info
+            filename = _basename(file_info) if file_info != "<stdin>" else file_info
             file_line_str = f" [{filename}]"
         elif line_info:
             file_line_str = f" [line:{line_info}]"
@@ -131,11 +132,6 @@ class FileLogFormatter(logging.Formatter):
             result = f"[{timestamp}] [{str(log_level)}] [PID:{process_id}|TID:{thread_id}]{file_line_str} (stderr): {message}"
         else:
             # Regular messages: [timestamp] [level] [PID|TID] [file:line] message
-            if record.levelno in {LogLevel.ERROR.logging_level(),
-                                  LogLevel.WARNING.logging_level(),
-                                  LogLevel.FATAL.logging_level(),
-                                  LogLevel.CRITICAL.logging_level()}:
-                level_name = level_name.upper()
             result = f"[{timestamp}] [{level_name}] [PID:{process_id}|TID:{thread_id}]{file_line_str} {message}"
 
         return result
@@ -148,13 +144,45 @@ class FileLogFormatter(logging.Formatter):
         :param: date_fmt:  the format string for dates and timestamps.
         :return: the formatted timestamp as string.
         """
-        ct = datetime.datetime.fromtimestamp(record.created)
         if datefmt is not None:
-            s = ct.strftime(datefmt)
-        else:
-            t = ct.strftime("%Y-%m-%d %H:%M:%S")
-            s = f"{t}.{int(record.msecs):05d}"
-        return s
+            return datetime.datetime.fromtimestamp(record.created).strftime(datefmt)
+        # Format each second once, swapping second and string as one tuple (see ConsoleFormatter.formatTime)
+        second = int(record.created)
+        cached_second, second_str = self._second_cache
+        if second != cached_second:
+            second_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._second_cache = (second, second_str)
+        return f"{second_str}.{int(record.msecs):05d}"
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler which leaves writing to the file buffer instead of flushing after every record.
+
+    Records at or above the flush level are flushed immediately, everything is flushed when the handler
+    is closed, which logging does at interpreter exit.
+    """
+
+    def __init__(self, filename: str | Path, mode: str, buffer_size: int, flush_level: int = logging.ERROR):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode=mode)
+
+    @overrides(logging.FileHandler)
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding,
+                    errors=self.errors)
+
+    @overrides(logging.FileHandler)
+    def emit(self, record: LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class FileLogChannel(LogChannelABC):
@@ -169,13 +197,26 @@ class FileLogChannel(LogChannelABC):
                  include_log_levels=None,
                  exclude_log_levels=None,
                  output_format: OutputFormat | str = None,
-                 custom_format: str = None):
+                 custom_format: str = None,
+                 buffer_size: int = None):
+        """
+        Initialize the file channel.
+        :param log_filename: path of the log file
+        :param logfile_open_mode: mode to open the log file with
+        :param minimum_log_level: minimum log level threshold
+        :param include_log_levels: specific levels to log
+        :param exclude_log_levels: specific levels to exclude
+        :param output_format: output format of the log entries
+        :param custom_format: format string for OutputFormat.CUSTOM
+        :param buffer_size: if given, entries are written in blocks of this many bytes instead of one by one;
+                            ERROR and above are written immediately, the rest at the latest by flush()
+        """
         super().__init__(minimum_log_level=minimum_log_level,
                          include_log_levels=include_log_levels,
                          exclude_log_levels=exclude_log_levels)
         if output_format is not None:
             if isinstance(output_format, str):
-                output_format = OutputFormat[output_format.upper()]
+                output_format = _output_format_by_name(output_format)
             self.output_format = output_format
         self.log_file = Path(log_filename)
 
@@ -187,7 +228,11 @@ class FileLogChannel(LogChannelABC):
         self.log_file.touch(exist_ok=True)
         self.do_file_log = True
 
-        filehandler = logging.FileHandler(log_filename, mode=logfile_open_mode)
+        if buffer_size:
+            filehandler = _BufferedFileHandler(log_filename, mode=logfile_open_mode, buffer_size=buffer_size)
+        else:
+            filehandler = logging.FileHandler(log_filename, mode=logfile_open_mode)
+        self._file_handler = filehandler
         filehandler.setFormatter(
             FileLogFormatter(output_format=self.output_format, channel=self, custom_format=custom_format))
         logging.basicConfig(format='[%(asctime)s]\t[%(levelname)s] [%(threadname)s] %(message)s',
@@ -196,6 +241,23 @@ class FileLogChannel(LogChannelABC):
                             handlers=[filehandler],
                             force=True)  # Force reconfiguration even if handlers already exist
 
+    @overrides(LogChannelABC)
+    def set_output_format(self, output_format: OutputFormat | str) -> None:
+        """
+        Set the output format for this file channel.
+
+        :param output_format: OutputFormat enum or string equivalent
+        """
+        super().set_output_format(output_format)
+        self._file_handler.formatter.output_format = self.output_format
+
+    @overrides(LogChannelABC)
+    def flush(self) -> None:
+        """
+        Write buffered log entries to the file.
+        """
+        self._file_handler.flush()
+
     @overrides(LogChannelABC)
     def do_log(self, log_level: LogLevel | str | int, *args, **kwargs) -> None:
         """
@@ -203,27 +265,26 @@ class FileLogChannel(LogChannelABC):
         :param log_level: the logging level
         :param kwargs: additional keyword arguments, including file and line info
         """
+        # Resolve names and numbers once, is_loggable() then takes its LogLevel fast path
+        log_level = _coerce_level(log_level)
         if not self.is_loggable(log_level):
             return
-        if isinstance(log_level, str):
-            log_level = LogLevel[log_level.upper()]
-        elif isinstance(log_level, int):
-            log_level = LogLevel.custom_level(log_level)
         # now log_level is LogLevel
+        level_int = log_level.logging_level()
+        if not logging.root.isEnabledFor(level_int):
+            # The root logger would drop the record, don't build it
+            return
 
-        # Extract file and line info for the LogRecord
+        # Extract file and line info for the LogRecord, kwargs is a new dict for every call
         extra = {}
         if 'file' in kwargs:
-            extra['file'] = kwargs['file']
+            extra['file'] = kwargs.pop('file')
         if 'line' in kwargs:
-            extra['line'] = kwargs['line']
-
-        # Remove file/line from kwargs so they don't interfere with message formatting
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k not in ('file', 'line')}
+            extra['line'] = kwargs.pop('line')
 
         # If user passed 'extra', merge it with our extra dict
-        if 'extra' in filtered_kwargs:
-            user_extra = filtered_kwargs.pop('extra')
+        if 'extra' in kwargs:
+            user_extra = kwargs.pop('extra')
             if isinstance(user_extra, dict):
                 extra.update(user_extra)
             # If it's not a dict, we can't merge, so ignore it (Python logging expects extra to be a dict)
@@ -231,4 +292,4 @@ class FileLogChannel(LogChannelABC):
         # Use the logging system with the configured FileHandler that has our FileLogFormatter
         # This ensures all log levels go through the formatter with location information
         message = args[0] if args else ""
-        logging.log(log_level.logging_level(), message, *args[1:], extra=extra, **filtered_kwargs)
+        logging.log(level_int, message, *args[1:], extra=extra, **kwargs)
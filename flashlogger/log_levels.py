@@ -93,8 +93,9 @@ class LogLevel(ExtendedEnum):
         Return the associated logging level for this flag.
         :return: the logging level integer
         """
-        if self in LogLevel.standard_mapping.values():
-            return {v: k for k, v in LogLevel.standard_mapping.items()}[self]
+        level_int = _LEVEL_INT.get(self)
+        if level_int is not None:
+            return level_int
 
         # Check if it's a command level
         if self == LogLevel.COMMAND:
@@ -186,8 +187,7 @@ class LogLevel(ExtendedEnum):
         :param update_active_link: if True, update the strings/active symlink to point to this file
         """
 
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            str_map_data = json.load(f)
+        str_map_data = json.loads(Path(json_file_path).read_bytes())
 
         # Load all string representations from the JSON file
         # Map LogLevel enum members where possible
@@ -248,8 +248,7 @@ class LogLevel(ExtendedEnum):
         Load custom level logging numbers from a JSON file.
         :param json_file_path: path to the JSON file containing custom level logging numbers
         """
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(Path(json_file_path).read_bytes())
 
         custom_levels = data.get("custom_levels", {})
 
@@ -310,6 +309,10 @@ class LogLevel(ExtendedEnum):
     def __str__(self) -> str:
         return LogLevel.custom_str_map.get(self, self.name.lower())
 
+    # Members are singletons compared by identity, so the identity hash can replace Enum.__hash__,
+    # which hashes the name in Python code on every dict or set lookup of a level
+    __hash__ = object.__hash__
+
 
 # Initialize custom logging levels (negative = unconfigured but distinct)
 LogLevel.custom_levels = [
@@ -346,9 +349,17 @@ LogLevel.standard_mapping = {
     logging.FATAL + 1: LogLevel.FATAL,
 }
 
+# Inverse of the standard mapping, so logging_level() does not rebuild it on every log call
+_LEVEL_INT = {level: level_int for level_int, level in LogLevel.standard_mapping.items()}
+
 # Storage for custom string representations
 LogLevel.custom_str_map = {}
 
+# Lower-case member names, precomputed for lookups keyed by level name
+for _log_level in LogLevel:
+    _log_level._key = _log_level.name.lower()
+del _log_level
+
 # Load default configurations on module import
 try:
     # Get config directory relative to this file
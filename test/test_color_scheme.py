@@ -26,7 +26,7 @@ import unittest
 from pathlib import Path
 import json
 
-from colorama import Style
+from colorama import Fore, Style
 
 from flashlogger.color_scheme import ColorScheme, Field
 from flashlogger.log_levels import LogLevel
@@ -172,8 +172,8 @@ class ColorSchemeTests(unittest.TestCase):
                 self.assertTrue(color_info.startswith('\x1b['))
                 self.assertTrue(bw_info.startswith('\x1b['))
 
-                # Plain text style should be normal (no color codes beyond style)
-                self.assertEqual(plain_info, "\x1b[22m")
+                # Plain text should have no ANSI codes at all
+                self.assertEqual(plain_info, "")
 
     def test_load_from_config_json(self):
         """Test loading display scheme from JSON config file."""
@@ -245,7 +245,8 @@ class ColorSchemeTests(unittest.TestCase):
                     color = cs.get(level)
                     colors.append(color)
                     # Should not contain ANSI escape codes
-                    self.assertEqual(color, "\x1b[22m")  # Only the style reset
+                    self.assertEqual(color, "")
+                    self.assertEqual(cs.get(level, style=Style.BRIGHT), "")
 
     def test_user_config_overrides_factory(self):
         """When a user config file exists it should be used instead of the package default."""
@@ -330,6 +331,228 @@ class ColorSchemeTests(unittest.TestCase):
         self.assertIsNone(cs.info_foreground)
         self.assertIsNone(cs.info_background)
 
+    def test_set_colors_refreshes_cached_prefix(self):
+        """Test that set_colors() invalidates the cached prefixes for the level."""
+        from colorama import Fore, Back
+
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        cs.get("info")
+        cs.get("info", inverse=True)
+
+        cs.set_colors(LogLevel.INFO, foreground=Fore.RED, background_inverse=Back.BLUE)
+
+        self.assertEqual(cs.get("info"), Style.NORMAL + Fore.RED)
+        self.assertTrue(cs.get(LogLevel.INFO, inverse=True).endswith(Back.BLUE))
+        self.assertEqual(cs.get("info", style=Style.BRIGHT), Style.BRIGHT + Fore.RED)
+
+    def test_set_colors_invalid_kind(self):
+        """Test that set_colors() rejects unknown color kinds."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        with self.assertRaises(ValueError):
+            cs.set_colors("info", underline="RED")
+
+    def test_legacy_color_attributes(self):
+        """Test read access to the per-level color attributes."""
+        from colorama import Fore, Back
+
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        cs.set_colors("error", foreground=Fore.RED, foreground_inverse=None, background_inverse=Back.RED)
+
+        self.assertEqual(cs.error_foreground, Fore.RED)
+        self.assertIsNone(cs.error_foreground_inverse)
+        self.assertEqual(cs.error_background_inverse, Back.RED)
+        with self.assertRaises(AttributeError):
+            _ = cs.unknown_level_foreground
+
+    def test_legacy_color_attribute_write(self):
+        """Test that writing a per-level color attribute updates the colors used for logging."""
+        import logging
+        from colorama import Fore
+        from flashlogger.log_channel_console import ConsoleFormatter
+
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        cs.get("warning")
+        cs.warning_foreground = Fore.MAGENTA
+
+        self.assertEqual(cs.warning_foreground, Fore.MAGENTA)
+        self.assertNotIn("warning_foreground", vars(cs))
+        self.assertIn(Fore.MAGENTA, cs.get(LogLevel.WARNING))
+
+        record = logging.LogRecord(name="test", level=logging.WARNING, pathname="", lineno=0,
+                                   msg="careful", args=(), exc_info=None)
+        self.assertIn(Fore.MAGENTA + "WARNING", ConsoleFormatter(color_scheme=cs).format(record))
+
+    def test_parsed_scheme_file_is_cached(self):
+        """Test that a scheme file is only parsed once while it is unchanged."""
+        import tempfile
+        from flashlogger.color_scheme import _load_scheme_json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "scheme.json"
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump({"info": {"foreground": "RED", "background": None}}, f)
+
+            _load_scheme_json.cache_clear()
+            cs1 = ColorScheme(colorscheme_json=config_path)
+            cs2 = ColorScheme(colorscheme_json=config_path)
+            self.assertEqual(_load_scheme_json.cache_info().misses, 1)
+            self.assertEqual(cs1.get("info"), cs2.get("info"))
+
+            # a modified file must be parsed again
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump({"info": {"foreground": "GREEN", "background": "BLACK"}}, f)
+            cs3 = ColorScheme(colorscheme_json=config_path)
+            self.assertEqual(_load_scheme_json.cache_info().misses, 2)
+            self.assertIn('32m', cs3.get("info"))
+
+    def test_loading_default_scheme_leaves_active_link_alone(self):
+        """Test that loading a default scheme does not rewrite the active symlink."""
+        from unittest.mock import patch
+
+        with patch.object(Path, "symlink_to") as symlink_to, patch.object(Path, "unlink") as unlink:
+            ColorScheme(ColorScheme.Default.BLACK_AND_WHITE)
+            ColorScheme(ColorScheme.Default.LIGHT_BG_COLOR)
+            symlink_to.assert_not_called()
+            unlink.assert_not_called()
+
+    def test_set_active_scheme_invalid(self):
+        """Test that set_active_scheme() rejects the NONE scheme."""
+        with self.assertRaises(ValueError):
+            ColorScheme.set_active_scheme(ColorScheme.Default.NONE)
+
+    def test_colorama_initialized_once_on_first_use(self):
+        """Test that colorama is initialized lazily and only once."""
+        from unittest.mock import patch
+        import flashlogger.color_scheme as color_scheme_module
+
+        with patch.object(color_scheme_module, "_colorama_initialized", False), \
+                patch.object(color_scheme_module, "_colorama_needed", return_value=True), \
+                patch.object(color_scheme_module, "colorama_init") as init:
+            ColorScheme(ColorScheme.Default.COLOR)
+            ColorScheme(ColorScheme.Default.PLAIN_TEXT)
+            init.assert_called_once()
+
+    def test_colorama_needed(self):
+        """Test that colorama is only needed on Windows or for redirected output."""
+        from unittest.mock import patch, MagicMock
+        import flashlogger.color_scheme as color_scheme_module
+
+        tty = MagicMock()
+        tty.isatty.return_value = True
+        redirected = MagicMock()
+        redirected.isatty.return_value = False
+        with patch.object(color_scheme_module.sys, "platform", "linux"):
+            with patch.object(color_scheme_module.sys, "stdout", tty), \
+                    patch.object(color_scheme_module.sys, "stderr", tty):
+                self.assertFalse(color_scheme_module._colorama_needed())
+            with patch.object(color_scheme_module.sys, "stdout", redirected), \
+                    patch.object(color_scheme_module.sys, "stderr", tty):
+                self.assertTrue(color_scheme_module._colorama_needed())
+        with patch.object(color_scheme_module.sys, "platform", "win32"):
+            self.assertTrue(color_scheme_module._colorama_needed())
+
+    def test_shared_returns_one_instance_per_arguments(self):
+        """Test that shared() constructs each scheme once."""
+        color = ColorScheme.shared(ColorScheme.Default.COLOR)
+        self.assertIs(color, ColorScheme.shared(ColorScheme.Default.COLOR))
+        self.assertIsNot(color, ColorScheme.shared(ColorScheme.Default.BLACK_AND_WHITE))
+        self.assertIs(ColorScheme.plain_text_singleton(), ColorScheme.shared(ColorScheme.Default.PLAIN_TEXT))
+
+        config_path = Path(__file__).parent.parent / "flashlogger" / "config" / "colors" / "factory" / "display_plain.json"
+        from_json = ColorScheme.shared(colorscheme_json=config_path)
+        self.assertIs(from_json, ColorScheme.shared(colorscheme_json=str(config_path)))
+        self.assertIsNot(from_json, color)
+
+    def test_copy_is_independent(self):
+        """Test that a copy has the same colors and can be changed without affecting the original."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        copied = cs.copy()
+        for level in cs.all_levels:
+            self.assertEqual(copied.get(level), cs.get(level))
+
+        copied.set_colors("info", foreground=Fore.MAGENTA)
+        self.assertEqual(copied.info_foreground, Fore.MAGENTA)
+        self.assertNotEqual(cs.info_foreground, Fore.MAGENTA)
+        self.assertNotEqual(cs.get("info"), copied.get("info"))
+
+    def test_plain_text_singleton(self):
+        """Test that plain_text_singleton() returns one shared plain scheme."""
+        cs = ColorScheme.plain_text_singleton()
+        self.assertIs(cs, ColorScheme.plain_text_singleton())
+        self.assertEqual(cs.get("info"), "")
+
+    def test_set_colors_ends_plain_text(self):
+        """Test that setting a color on a plain scheme makes get() return ANSI codes."""
+        from colorama import Fore
+
+        cs = ColorScheme(colorscheme_json=Path(__file__).parent.parent / "flashlogger" / "config" / "colors" /
+                         "factory" / "display_plain.json")
+        self.assertEqual(cs.get("error"), "")
+        cs.set_colors("error", foreground=Fore.RED)
+        self.assertEqual(cs.get("error"), Style.NORMAL + Fore.RED)
+
+    def test_get_uses_member_name_not_custom_label(self):
+        """Test that get() looks up enums by member name even when a custom label is set."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        saved_str_map = dict(LogLevel.custom_str_map)
+        LogLevel.set_str_repr(LogLevel.INFO, "Information")
+        try:
+            self.assertEqual(cs.get(LogLevel.INFO), cs.get("info"))
+            self.assertEqual(cs.get(Field.TIMESTAMP), cs.get("timestamp"))
+        finally:
+            LogLevel.clear_str_reprs()
+            LogLevel.set_str_reprs(saved_str_map)
+
+    def test_prefix_for_matches_get(self):
+        """Test that prefix_for() returns the same code as get() with the normal style."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        for level in (LogLevel.WARNING, Field.TIMESTAMP, "message"):
+            self.assertEqual(cs.prefix_for(level), cs.get(level))
+            self.assertEqual(cs.prefix_for(level, inverse=True), cs.get(level, inverse=True))
+            self.assertEqual(cs.prefix_for(level, style=Style.BRIGHT), cs.get(level, style=Style.BRIGHT))
+
+    def test_save_to_json_round_trip(self):
+        """Test that a saved scheme loads back with the same colors."""
+        import tempfile
+
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        cs.set_colors("info", foreground=Fore.LIGHTCYAN_EX, background=None)
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "saved.json"
+            cs.save_to_json(config_path)
+            with open(config_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["info"], {"foreground": "LIGHTCYAN_EX", "background": None})
+            self.assertEqual(data, cs.to_config())
+
+            loaded = ColorScheme(colorscheme_json=config_path)
+            for level in cs.all_levels:
+                self.assertEqual(loaded.get(level), cs.get(level))
+
+    def test_none_style_is_normal_style(self):
+        """Test that prefix_for() and colorize() accept None for the normal style, like get()."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        self.assertEqual(cs.prefix_for("info", style=None), cs.prefix_for("info"))
+        self.assertEqual(cs.prefix_for("info", inverse=True, style=None), cs.get("info", inverse=True, style=None))
+        self.assertEqual(cs.colorize("error", "text", style=None), cs.colorize("error", "text"))
+
+    def test_colorize(self):
+        """Test that colorize() wraps the formatted message in the level prefix and a reset code."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        self.assertEqual(cs.colorize(LogLevel.INFO, "%d files copied", 3),
+                         cs.get("info") + "3 files copied" + Style.RESET_ALL)
+        self.assertEqual(cs.colorize("error", "100% done", style=Style.BRIGHT),
+                         cs.get("error", style=Style.BRIGHT) + "100% done" + Style.RESET_ALL)
+        self.assertEqual(ColorScheme.plain_text_singleton().colorize("info", "plain"), "plain" + Style.RESET_ALL)
+
+    def test_set_colors_refreshes_styled_prefixes(self):
+        """Test that set_colors() drops the cached prefixes of every style."""
+        cs = ColorScheme(ColorScheme.Default.COLOR)
+        cs.prefix_for("info", style=Style.DIM)
+        cs.set_colors("info", foreground=Fore.RED)
+        self.assertEqual(cs.prefix_for("info", style=Style.DIM), Style.DIM + Fore.RED + (cs.info_background or ""))
+        self.assertEqual(cs.get("info", style=Style.BRIGHT), cs.prefix_for("info", style=Style.BRIGHT))
+
 
 if __name__ == '__main__':
     unittest.main()
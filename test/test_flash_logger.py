@@ -22,6 +22,8 @@
 # @date: 2025-10-24
 # @author: Dieter J Kybelksties
 
+import io
+import sys
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -72,6 +74,12 @@ class FlashLoggerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             FlashLogger([])
 
+        class NotIterable:
+            __iter__ = None
+
+        with self.assertRaises(ValueError):
+            FlashLogger(NotIterable())
+
     def test_add_channel(self):
         """Test adding channels."""
         logger = FlashLogger(MockChannel())
@@ -147,6 +155,108 @@ class FlashLoggerTests(unittest.TestCase):
         self.assertIn("file", kwargs)  # file info added by our logging system
         self.assertIn("line", kwargs)  # line info added by our logging system
 
+    def test_log_skips_call_site_when_no_channel_needs_it(self):
+        """Test that the stack is only inspected if a channel shows the call site."""
+        channel = MockChannel()
+        logger = FlashLogger(channel)
+
+        with patch.object(MockChannel, "needs_call_site", False), \
+                patch('flashlogger.flash_logger._get_call_site_info') as mock_call_site:
+            logger.log_info("Test message")
+            mock_call_site.assert_not_called()
+        _, _, kwargs = channel.logged_messages[0]
+        self.assertIsNone(kwargs["file"])
+        self.assertIsNone(kwargs["line"])
+
+        with patch('flashlogger.flash_logger._get_call_site_info', return_value=("f.py", 1)) as mock_call_site:
+            logger.log_info("Test message")
+            mock_call_site.assert_called_once()
+        _, _, kwargs = channel.logged_messages[1]
+        self.assertEqual((kwargs["file"], kwargs["line"]), ("f.py", 1))
+
+    def test_log_only_dispatches_to_channels_accepting_the_level(self):
+        """Test that filtered records are neither inspected nor dispatched."""
+        class WarningChannel(MockChannel):
+            def __init__(self):
+                LogChannelABC.__init__(self, minimum_log_level=LogLevel.WARNING)
+                self.logged_messages = []
+
+        warning_channel = WarningChannel()
+        logger = FlashLogger(warning_channel)
+        with patch('flashlogger.flash_logger._get_call_site_info') as mock_call_site:
+            logger.log_info("filtered")
+            mock_call_site.assert_not_called()
+        self.assertEqual(warning_channel.logged_messages, [])
+
+        all_channel = MockChannel()
+        logger.add_channel(all_channel)
+        logger.log_info("info")
+        logger.log_error("error")
+        self.assertEqual([args for _, args, _ in warning_channel.logged_messages], [("error",)])
+        self.assertEqual([args for _, args, _ in all_channel.logged_messages], [("info",), ("error",)])
+
+    def test_enqueue_dispatches_in_background(self):
+        """Test that an enqueuing logger hands records to the channels in the background."""
+        import threading
+
+        class ThreadRecordingChannel(MockChannel):
+            def do_log(self, level, *args, **kwargs):
+                super().do_log(level, *args, **kwargs)
+                self.threads.append((threading.get_ident(), self.thread_id))
+
+        channel = ThreadRecordingChannel()
+        channel.threads = []
+        logger = FlashLogger(channel, enqueue=True)
+        for i in range(10):
+            logger.log_info("message %d", i)
+        logger.flush()
+
+        self.assertEqual([args for _, args, _ in channel.logged_messages], [("message %d", i) for i in range(10)])
+        caller = threading.get_ident()
+        for dispatcher, reported in channel.threads:
+            self.assertNotEqual(dispatcher, caller)
+            self.assertEqual(reported, caller)
+        self.assertEqual(channel.thread_id, caller)
+
+    def test_close_stops_dispatcher(self):
+        """Test that close() dispatches the enqueued records, stops the dispatcher and logs directly afterwards."""
+        import threading
+
+        channel = MockChannel()
+        with patch('flashlogger.flash_logger.atexit') as mock_atexit:
+            logger = FlashLogger(channel, enqueue=True)
+            dispatcher = logger._dispatcher
+            for i in range(10):
+                logger.log_info("message %d", i)
+            logger.close()
+            mock_atexit.unregister.assert_called_once_with(logger.flush)
+
+        self.assertFalse(dispatcher.is_alive())
+        self.assertEqual(len(channel.logged_messages), 10)
+        logger.log_info("after close")
+        self.assertEqual(channel.logged_messages[-1][1], ("after close",))
+        self.assertEqual(channel.thread_id, threading.get_ident())
+        logger.close()
+
+    def test_flush_from_dispatcher_thread(self):
+        """Test that a channel flushing the logger from the dispatcher thread does not wait for itself."""
+        import threading
+
+        class FlushingChannel(MockChannel):
+            def do_log(self, level, *args, **kwargs):
+                super().do_log(level, *args, **kwargs)
+                logger.flush()
+
+        channel = FlushingChannel()
+        logger = FlashLogger(channel, enqueue=True)
+        logger.log_info("flushes")
+        flusher = threading.Thread(target=logger.flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=10)
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(len(channel.logged_messages), 1)
+        logger.close()
+
     def test_log_level_shortcuts(self):
         """Test all log level shortcut methods."""
         channel = MockChannel()
@@ -179,6 +289,57 @@ class FlashLoggerTests(unittest.TestCase):
         for i, (level, args, kwargs) in enumerate(channel.logged_messages):
             self.assertEqual(level, expected_levels[i])
 
+    def test_should_log(self):
+        """Test checking whether any channel accepts a level."""
+        channel = MockChannel()
+        channel.log_levels = LogLevel.WARNING
+        logger = FlashLogger(channel)
+
+        self.assertFalse(logger.should_log(LogLevel.INFO))
+        self.assertFalse(logger.should_log("debug"))
+        self.assertTrue(logger.should_log(LogLevel.ERROR))
+        self.assertTrue(logger.should_log("warning"))
+
+        logger.add_channel(MockChannel())
+        self.assertTrue(logger.should_log(LogLevel.INFO))
+
+    def test_log_many(self):
+        """Test logging several records with one call site inspection."""
+        channel = MockChannel()
+        logger = FlashLogger(channel)
+
+        with patch('flashlogger.flash_logger._get_call_site_info', return_value=("f.py", 1)) as mock_call_site:
+            logger.log_many([(LogLevel.INFO, ("first",)),
+                             (LogLevel.WARNING, ("second %s", "arg"), {"key": "value"}),
+                             (LogLevel.ERROR, ("third",), {"line": 7})])
+            mock_call_site.assert_called_once()
+
+        self.assertEqual([(level, args) for level, args, _ in channel.logged_messages],
+                         [(LogLevel.INFO, ("first",)),
+                          (LogLevel.WARNING, ("second %s", "arg")),
+                          (LogLevel.ERROR, ("third",))])
+        self.assertEqual(channel.logged_messages[1][2], {"file": "f.py", "line": 1, "key": "value"})
+        self.assertEqual(channel.logged_messages[2][2], {"file": "f.py", "line": 7})
+
+    def test_log_many_wraps_bare_arguments(self):
+        """Test that log_many() passes arguments which are not a tuple or list as a single argument."""
+        channel = MockChannel()
+        logger = FlashLogger(channel)
+        logger.log_many([(LogLevel.INFO, "message"), (LogLevel.INFO, ["a", "b"]), (LogLevel.INFO, 42)])
+
+        self.assertEqual([args for _, args, _ in channel.logged_messages], [("message",), ("a", "b"), (42,)])
+
+    def test_log_many_filters_records(self):
+        """Test that log_many skips records no channel accepts."""
+        channel = MockChannel()
+        channel.log_levels = [LogLevel.ERROR]
+        logger = FlashLogger(channel)
+
+        logger.log_many([(LogLevel.INFO, ("filtered",)), (LogLevel.ERROR, ("logged",))])
+
+        self.assertEqual([args for _, args, _ in channel.logged_messages], [("logged",)])
+        self.assertEqual(channel.logged_messages[0][2]["file"], __file__)
+
     def test_log_header(self):
         """Test log_header method."""
         channel = MockChannel()
@@ -241,6 +402,47 @@ class FlashLoggerTests(unittest.TestCase):
         except Exception:
             self.fail("Logging should not raise exceptions from channels")
 
+    def test_channel_exception_reports_are_rate_limited(self):
+        """Test that a failing channel is reported at powers of two and finally removed."""
+
+        class FailingChannel(LogChannelABC):
+            def do_log(self, level, *args, **kwargs):
+                raise Exception("Channel failed")
+
+        failing_channel = FailingChannel()
+        working_channel = MockChannel()
+        logger = FlashLogger([failing_channel, working_channel])
+
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr, \
+                patch('sys.stdout', new_callable=io.StringIO):
+            for _ in range(16):
+                logger.log(LogLevel.INFO, "Test")
+            self.assertEqual(stderr.getvalue().count("Error logging to channel"), 5)  # 1, 2, 4, 8, 16
+
+            for _ in range(100):
+                logger.log(LogLevel.INFO, "Test")
+            self.assertIn("Removing channel FailingChannel", stderr.getvalue())
+
+        self.assertEqual(logger.log_channels, [working_channel])
+        self.assertEqual(len(working_channel.logged_messages), 116)
+
+    def test_channel_removed_during_dispatch_of_unknown_level(self):
+        """Test that removing a failing channel does not skip the next channel for an unknown level."""
+
+        class FailingChannel(LogChannelABC):
+            def do_log(self, level, *args, **kwargs):
+                raise ValueError(f"Unknown level: {level}")
+
+        working_channel = MockChannel()
+        logger = FlashLogger([FailingChannel(), working_channel])
+
+        with patch('sys.stderr', new_callable=io.StringIO), patch('sys.stdout', new_callable=io.StringIO):
+            for _ in range(101):
+                logger.log("no_such_level", "Test")
+
+        self.assertEqual(logger.log_channels, [working_channel])
+        self.assertEqual(len(working_channel.logged_messages), 101)
+
     def test_get_logger_creates_default_logger(self):
         """Test get_logger creates default console logger."""
         logger = get_logger()
@@ -267,6 +469,30 @@ class FlashLoggerTests(unittest.TestCase):
             mock_logger.log_warning.assert_called_once_with("test")
             mock_logger.log_error.assert_called_once_with("test")
 
+    def test_call_site_is_the_caller_of_the_log_wrappers(self):
+        """Test that file and line point to the calling code for methods, log() and global functions."""
+        import flashlogger.flash_logger as flash_logger_module
+        channel = MockChannel()
+        logger = FlashLogger(channel)
+
+        def line_of_next_call():
+            return sys._getframe(1).f_lineno + 1
+
+        expected_lines = [line_of_next_call()]
+        logger.log_info("method")
+        expected_lines.append(line_of_next_call())
+        logger.log(LogLevel.INFO, "log")
+        expected_lines.append(line_of_next_call())
+        logger.log_header("header")
+        with patch.object(flash_logger_module, "_global_logger", logger):
+            expected_lines.append(line_of_next_call())
+            log_info("global")
+            expected_lines.append(line_of_next_call())
+            flash_logger_module.log(LogLevel.INFO, "global log")
+
+        self.assertEqual([kwargs["file"] for _, _, kwargs in channel.logged_messages], [__file__] * 5)
+        self.assertEqual([kwargs["line"] for _, _, kwargs in channel.logged_messages], expected_lines)
+
     def test_get_logger_with_console_channel(self):
         """Test get_logger adds console channel when requested."""
         # Clear any existing logger
@@ -383,6 +609,22 @@ class FlashLoggerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             logger.get_channel("nonexistent")
 
+    def test_get_channel_by_name_after_remove(self):
+        """Test that name lookups do not return a removed channel."""
+        console_channel = LogChannelConsole()
+        mock_channel = MockChannel()
+        logger = FlashLogger([console_channel, mock_channel])
+
+        self.assertIs(logger.get_channel("console"), console_channel)
+        self.assertIs(logger.get_channel("console"), console_channel)
+        logger.remove_channel(console_channel)
+        with self.assertRaises(ValueError):
+            logger.get_channel("console")
+
+        new_console = LogChannelConsole()
+        logger.add_channel(new_console)
+        self.assertIs(logger.get_channel("console"), new_console)
+
     def test_get_channel_by_instance(self):
         """Test getting channel by channel instance."""
         channel1 = MockChannel()
@@ -413,6 +655,17 @@ class FlashLoggerTests(unittest.TestCase):
             self.assertIsInstance(logger.log_channels[0], LogChannelConsole)
             self.assertIsInstance(logger.log_channels[1], FileLogChannel)
 
+    def test_log_file_channel_flushed_at_exit(self):
+        """Test that the buffered file channel created for log_file is flushed by an exit handler."""
+        import tempfile
+
+        with tempfile.NamedTemporaryFile() as temp_file, \
+                patch('flashlogger.flash_logger.atexit') as mock_atexit:
+            logger = FlashLogger(log_file=temp_file.name)
+            file_channel = logger.log_channels[0]
+            mock_atexit.register.assert_called_once_with(file_channel.flush)
+            self.assertEqual(file_channel._file_handler.buffer_size, 64 * 1024)
+
     def test_add_channel_with_selector(self):
         """Test adding channels with custom selectors."""
         logger = FlashLogger(MockChannel())
@@ -444,6 +697,26 @@ class FlashLoggerTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             logger.get_channel("removable")
 
+    def test_remove_channel_drops_all_its_selectors(self):
+        """Test that removing a channel drops every selector still pointing to it."""
+        channel1 = MockChannel()
+        logger = FlashLogger(channel1)
+        channel2 = MockChannel()
+        logger.add_channel(channel2, selector="first")
+        logger.add_channel(channel2, selector="second")
+        logger.add_channel(channel2, selector="moved")
+        logger.add_channel(channel1, selector="moved")
+        self.assertEqual(len(logger.log_channels), 2)
+
+        logger.remove_channel(channel2)
+
+        self.assertEqual(logger.log_channels, [channel1])
+        self.assertNotIn(channel2, logger._channel_ids.values())
+        for selector in ("first", "second"):
+            with self.assertRaises(ValueError):
+                logger.get_channel(selector)
+        self.assertIs(logger.get_channel("moved"), channel1)
+
     def test_default_channel(self):
         """Test default channel."""
         logger = FlashLogger(console=ColorScheme.Default.COLOR)
@@ -453,5 +726,30 @@ class FlashLoggerTests(unittest.TestCase):
         logger.log_command_stderr("unsuccessful command")
 
 
+    def test_package_exports_are_lazy(self):
+        """Test that the package resolves its public names on first access."""
+        import colorama
+        import flashlogger
+
+        self.assertIs(flashlogger.FlashLogger, FlashLogger)
+        self.assertIs(flashlogger.log_info, log_info)
+        self.assertIn("LogChannelConsole", dir(flashlogger))
+        self.assertIs(flashlogger.Fore, colorama.Fore)
+        self.assertIs(flashlogger.Back, colorama.Back)
+        self.assertIs(flashlogger.Style, colorama.Style)
+        with self.assertRaises(AttributeError):
+            _ = flashlogger.no_such_name
+
+    def test_package_init_loaded_once(self):
+        """Test that the package has a single __init__.py which is never loaded as a second module."""
+        import sys
+        from pathlib import Path
+        import flashlogger
+
+        package_dir = Path(flashlogger.__file__).parent
+        self.assertEqual([p.name for p in package_dir.rglob("__init__.py")], ["__init__.py"])
+        self.assertNotIn("flashlogger.__init__", sys.modules)
+
+
 if __name__ == '__main__':
     unittest.main()
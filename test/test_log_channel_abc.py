@@ -22,11 +22,15 @@
 # @date: 2025-10-24
 # @author: Dieter J Kybelksties
 
+import datetime
+import json
 import logging
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 
-from flashlogger.log_channel_abc import LogChannelABC, OutputFormat
+from flashlogger.log_channel_abc import (LevelSpec, LogChannelABC, OutputFormat, _coerce_level, _dumps_record,
+                                         _output_format_by_name, _record_level, use_orjson)
 from flashlogger.log_levels import LogLevel
 
 
@@ -68,6 +72,16 @@ class LogChannelABCTests(unittest.TestCase):
         logger = LogChannelABC.get_shared_logger()
         self.assertEqual(logger.level, logging.INFO)
 
+    def test_configure_shared_logger_reuses_formatter(self):
+        """Test that reconfiguring with the same format string reuses the formatter."""
+        LogChannelABC.configure_shared_logger(format_str="%(levelname)s: %(message)s")
+        logger = LogChannelABC.get_shared_logger()
+        formatter = logger.handlers[0].formatter
+
+        LogChannelABC.configure_shared_logger(format_str="%(levelname)s: %(message)s")
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIs(logger.handlers[0].formatter, formatter)
+
     @patch("flashlogger.log_channel_abc.LogChannelABC.get_shared_logger")
     def test_configure_shared_logger_format(self, mock_get_logger):
         """Test configure_shared_logger sets formatter."""
@@ -158,6 +172,30 @@ class LogChannelABCTests(unittest.TestCase):
         self.assertFalse(channel.is_loggable(LogLevel.INFO))
         self.assertTrue(channel.is_loggable(LogLevel.WARNING))
 
+    def test_minimum_log_level_follows_custom_level_changes(self):
+        """Test that cached thresholds account for custom levels assigned later."""
+        original_custom_levels = list(LogLevel.custom_levels)
+        self.addCleanup(setattr, LogLevel, "custom_levels", original_custom_levels)
+
+        self.assertNotIn(LogLevel.CUSTOM0, MockLogChannel(minimum_log_level=LogLevel.WARNING).log_levels)
+        LogLevel.custom_levels = [logging.WARNING + 5] + original_custom_levels[1:]
+        channel = MockLogChannel(minimum_log_level=LogLevel.WARNING)
+        self.assertIn(LogLevel.CUSTOM0, channel.log_levels)
+
+        # The channel gets its own set, so changing it does not affect other channels
+        channel.log_levels.discard(LogLevel.ERROR)
+        self.assertIn(LogLevel.ERROR, MockLogChannel(minimum_log_level=LogLevel.WARNING).log_levels)
+
+    def test_channels_share_level_sets_until_accessed(self):
+        """Test that equally configured channels share their levels until log_levels is read."""
+        channel1 = MockLogChannel(include_log_levels=[LogLevel.INFO, LogLevel.ERROR])
+        channel2 = MockLogChannel(include_log_levels=["error", "info"])
+        self.assertIs(channel1._LogChannelABC__loggable_levels, channel2._LogChannelABC__loggable_levels)
+
+        channel1.log_levels.add(LogLevel.DEBUG)
+        self.assertTrue(channel1.is_loggable(LogLevel.DEBUG))
+        self.assertFalse(channel2.is_loggable(LogLevel.DEBUG))
+
     def test_minimal_log_level_property_getter(self):
         """Test minimal_log_level property getter."""
         channel = MockLogChannel(minimum_log_level=LogLevel.WARNING)
@@ -192,6 +230,21 @@ class LogChannelABCTests(unittest.TestCase):
         self.assertFalse(channel.is_loggable(LogLevel.INFO))
         self.assertTrue(channel.is_loggable(LogLevel.WARNING))
 
+    def test_level_spec(self):
+        """Test explicit level filters in the setter and the constructor."""
+        channel = MockLogChannel()
+        channel.log_levels = LevelSpec.threshold("warning")
+        self.assertEqual(channel.log_levels, MockLogChannel(minimum_log_level=LogLevel.WARNING).log_levels)
+
+        channel.log_levels = LevelSpec.include(LogLevel.INFO, "error")
+        self.assertEqual(channel.log_levels, {LogLevel.INFO, LogLevel.ERROR})
+
+        channel.log_levels = LevelSpec.exclude(LogLevel.DEBUG)
+        self.assertEqual(channel.log_levels, set(LogLevel) - {LogLevel.DEBUG})
+
+        channel = MockLogChannel(minimum_log_level=LevelSpec.include(LogLevel.FATAL))
+        self.assertEqual(channel.log_levels, {LogLevel.FATAL})
+
     def test_is_loggable_by_string(self):
         """Test is_loggable accepts string log levels."""
         channel = MockLogChannel(minimum_log_level=LogLevel.WARNING)
@@ -206,6 +259,29 @@ class LogChannelABCTests(unittest.TestCase):
         self.assertFalse(channel.is_loggable(logging.DEBUG))
         self.assertTrue(channel.is_loggable(logging.WARNING))
 
+    def test_coerce_level(self):
+        """Test converting level names and numbers to LogLevel."""
+        self.assertIs(_coerce_level(LogLevel.INFO), LogLevel.INFO)
+        self.assertIs(_coerce_level("warning"), LogLevel.WARNING)
+        self.assertIs(_coerce_level("Warning"), LogLevel.WARNING)
+        self.assertIs(_coerce_level(logging.ERROR), LogLevel.ERROR)
+        self.assertIsNone(_coerce_level(None))
+        with self.assertRaises(KeyError):
+            _coerce_level("no_such_level")
+
+    def test_record_level(self):
+        """Test resolving a record's level number to the level and its printed name."""
+        self.assertEqual(_record_level(logging.INFO), (LogLevel.INFO, "info"))
+        self.assertEqual(_record_level(logging.ERROR), (LogLevel.ERROR, "ERROR"))
+        self.assertEqual(_record_level(logging.WARNING), (LogLevel.WARNING, "WARNING"))
+        original_str_map = dict(LogLevel.custom_str_map)
+        LogLevel.set_str_repr(LogLevel.INFO, "Information")
+        try:
+            self.assertEqual(_record_level(logging.INFO), (LogLevel.INFO, "information"))
+        finally:
+            LogLevel.clear_str_reprs()
+            LogLevel.set_str_reprs(original_str_map)
+
     def test_do_log_not_implemented_in_abstract_class(self):
         """Test that abstract class cannot be instantiated without implementing do_log."""
         class PartialChannel(LogChannelABC):
@@ -214,6 +290,26 @@ class LogChannelABCTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             PartialChannel()
 
+    def test_process_id(self):
+        """Test that the cached process ID is the current one."""
+        self.assertEqual(MockLogChannel().process_id, os.getpid())
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_process_id_after_fork(self):
+        """Test that a forked child reports its own process ID."""
+        channel = MockLogChannel()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, str(channel.process_id == os.getpid()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            result = pipe.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(result, "True")
+
     def test_output_format_default(self):
         """Test default output_format is HUMAN_READABLE."""
         channel = MockLogChannel()
@@ -227,6 +323,62 @@ class LogChannelABCTests(unittest.TestCase):
         self.assertEqual(OutputFormat.CUSTOM.name, "CUSTOM")
         self.assertEqual(len(OutputFormat), 4)
 
+    def test_output_format_by_name(self):
+        """Test looking up output formats by name regardless of case."""
+        self.assertIs(_output_format_by_name("JSON_LINES"), OutputFormat.JSON_LINES)
+        self.assertIs(_output_format_by_name("json_pretty"), OutputFormat.JSON_PRETTY)
+        self.assertIs(_output_format_by_name("Human_Readable"), OutputFormat.HUMAN_READABLE)
+        with self.assertRaises(KeyError):
+            _output_format_by_name("xml")
+
+    def test_dumps_record_standard_library_layout(self):
+        """Test that records are serialized with the standard library layout unless orjson is opted in to."""
+        data = {"message": "Grüße", "level": LogLevel.INFO, "values": [1, 2], 3: "int key",
+                "logged": datetime.datetime(2025, 11, 2, 8, 30, 15, 250)}
+        expected = {"message": "Grüße", "level": str(LogLevel.INFO), "values": [1, 2], "3": "int key",
+                    "logged": "2025-11-02 08:30:15.000250"}
+        self.assertEqual(_dumps_record(data, False), json.dumps(expected))
+        self.assertEqual(_dumps_record(data, True), json.dumps(expected, indent=4))
+        self.assertIn('"level": "info"', _dumps_record(data, False))
+
+    def test_dumps_record_with_orjson(self):
+        """Test the orjson layout, which writes the same values as the standard library."""
+        data = {"message": "Grüße", "level": LogLevel.INFO, "values": [1, 2], 3: "int key",
+                "logged": datetime.datetime(2025, 11, 2, 8, 30, 15, 250)}
+        if not use_orjson():
+            self.skipTest("orjson is not installed")
+        try:
+            self.assertEqual(_dumps_record(data, False),
+                             '{"message":"Grüße","level":"info","values":[1,2],"3":"int key",'
+                             '"logged":"2025-11-02 08:30:15.000250"}')
+            self.assertEqual(json.loads(_dumps_record(data, True)), json.loads(_dumps_record(data, False)))
+            self.assertTrue(_dumps_record(data, True).startswith('{\n  "message"'))
+            self.assertEqual(_dumps_record({"big": 2 ** 70}, False), '{"big":%d}' % 2 ** 70)
+        finally:
+            use_orjson(False)
+
+        with patch("flashlogger.log_channel_abc.orjson", None):
+            self.assertFalse(use_orjson())
+
+    def test_slotted_subclass(self):
+        """Test that a subclass declaring __slots__ works without an instance __dict__."""
+        class SlottedChannel(LogChannelABC):
+            __slots__ = ()
+
+            def do_log(self, log_level, *args, **kwargs):
+                pass
+
+        channel = SlottedChannel(minimum_log_level=LogLevel.WARNING)
+        self.assertFalse(hasattr(channel, "__dict__"))
+        self.assertTrue(channel.is_loggable(LogLevel.ERROR))
+        self.assertFalse(channel.is_loggable(LogLevel.INFO))
+
+    def test_field_order_is_per_channel(self):
+        """Test that changing the field order of one channel does not affect others."""
+        channel = MockLogChannel()
+        channel.field_order.remove("pid")
+        self.assertIn("pid", MockLogChannel().field_order)
+
     def test_field_order_default(self):
         """Test default field_order."""
         from flashlogger.log_channel_abc import LogField
@@ -22,16 +22,21 @@
 # @date: 2025-10-24
 # @author: Dieter J Kybelksties
 
+import datetime
+import io
 import logging
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 import json
 
+from colorama import Style
+
 from flashlogger.color_scheme import ColorScheme
 from flashlogger.log_channel_abc import OutputFormat
-from flashlogger.log_channel_console import LogChannelConsole, ConsoleFormatter
+from flashlogger.log_channel_console import LogChannelConsole, ConsoleFormatter, _AsyncBatchHandler
 from flashlogger.log_levels import LogLevel
 
 
@@ -91,6 +96,69 @@ class ConsoleFormatterTests(unittest.TestCase):
         time_str = formatter.formatTime(record)
         self.assertIn("00123", time_str)  # Based on int(record.msecs) formatted as 05d
 
+    def test_format_time_reuses_second_and_matches_datetime(self):
+        """Test that formatTime formats each second once and matches datetime formatting."""
+        formatter = ConsoleFormatter()
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="test", args=(), exc_info=None
+        )
+        for created in (1234567890.1, 1234567890.9, 1234567891.5):
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            expected = datetime.datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+            self.assertEqual(formatter.formatTime(record), f"{expected}.{int(record.msecs):05d}")
+            self.assertEqual(formatter._second_cache, (int(created), expected))
+
+    def test_format_follows_field_order_changes(self):
+        """Test that replacing or changing the field order in place changes the fields written."""
+        formatter = ConsoleFormatter(color_scheme=ColorScheme.plain_text_singleton())
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="Ordered message", args=(), exc_info=None
+        )
+        self.assertIn("pid:", formatter.format(record))
+
+        formatter.field_order = ["message", "level", "unknown"]
+        self.assertEqual(formatter.format(record),
+                         "[" + Style.RESET_ALL + "Ordered message" + Style.RESET_ALL + "]" + Style.RESET_ALL + " "
+                         "[" + Style.RESET_ALL + "info" + Style.RESET_ALL + "]" + Style.RESET_ALL)
+
+        formatter.field_order.remove("level")
+        self.assertEqual(formatter.format(record),
+                         "[" + Style.RESET_ALL + "Ordered message" + Style.RESET_ALL + "]" + Style.RESET_ALL)
+
+        formatter.field_order.clear()
+        self.assertEqual(formatter.format(record), "")
+
+    def test_format_uses_prefixes_of_new_color_scheme(self):
+        """Test that replacing the color scheme rebinds the field colors."""
+        formatter = ConsoleFormatter(color_scheme=ColorScheme(ColorScheme.Default.COLOR))
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="Plain message", args=(), exc_info=None
+        )
+        self.assertIn(formatter.color_scheme.get("message") + "Plain message", formatter.format(record))
+
+        formatter.color_scheme = ColorScheme.plain_text_singleton()
+        self.assertIn("[" + Style.RESET_ALL + "Plain message", formatter.format(record))
+
+    def test_format_keeps_colors_of_relabelled_level(self):
+        """Test that a level with a custom label is still colored by its member name."""
+        formatter = ConsoleFormatter(color_scheme=ColorScheme(ColorScheme.Default.COLOR))
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="Labelled message", args=(), exc_info=None
+        )
+        saved_str_map = dict(LogLevel.custom_str_map)
+        LogLevel.set_str_repr(LogLevel.INFO, "Information")
+        try:
+            result = formatter.format(record)
+        finally:
+            LogLevel.clear_str_reprs()
+            LogLevel.set_str_reprs(saved_str_map)
+        self.assertIn(formatter.color_scheme.get("info", style=Style.BRIGHT) + "information", result)
+
     @patch('flashlogger.log_channel_console.ColorScheme')
     def test_color_level_methods(self, _mock_color_scheme):
         """Test that formatter uses simplified ColorScheme."""
@@ -105,6 +173,47 @@ class ConsoleFormatterTests(unittest.TestCase):
         self.assertTrue(hasattr(formatter, 'set_level_color'))
         self.assertTrue(callable(getattr(formatter, 'set_level_color')))
 
+    def test_set_level_color(self):
+        """Test that set_level_color resolves color names and falls back for unknown names."""
+        from colorama import Fore, Back
+        formatter = ConsoleFormatter(color_scheme=ColorScheme(ColorScheme.Default.COLOR))
+        formatter.set_level_color("info", foreground="red", background="blue")
+        self.assertEqual(formatter.color_scheme.info_foreground, Fore.RED)
+        self.assertEqual(formatter.color_scheme.info_background, Back.BLUE)
+
+        formatter.set_level_color(LogLevel.DEBUG, foreground="NO_SUCH_COLOR", background="NO_SUCH_COLOR")
+        self.assertEqual(formatter.color_scheme.debug_foreground, Fore.WHITE)
+        self.assertEqual(formatter.color_scheme.debug_background, Back.BLACK)
+
+    def test_format_uses_level_color_set_after_first_record(self):
+        """Test that the level tag follows set_level_color() after records of the level were formatted."""
+        formatter = ConsoleFormatter(color_scheme=ColorScheme(ColorScheme.Default.COLOR))
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0,
+            msg="Colored message", args=(), exc_info=None
+        )
+        formatter.format(record)
+        formatter.set_level_color("info", foreground="red", background="blue")
+        self.assertIn(formatter.color_scheme.prefix_for(LogLevel.INFO, style=Style.BRIGHT) + "info",
+                      formatter.format(record))
+
+    def test_format_follows_colors_set_on_scheme(self):
+        """Test that the bound tags follow colors set on the color scheme itself."""
+        from colorama import Fore
+        color_scheme = ColorScheme(ColorScheme.Default.COLOR)
+        formatter = ConsoleFormatter(color_scheme=color_scheme)
+        record = logging.LogRecord(
+            name="test", level=logging.WARNING, pathname="", lineno=0,
+            msg="Colored message", args=(), exc_info=None
+        )
+        formatter.format(record)
+
+        color_scheme.set_colors("message", foreground=Fore.RED)
+        color_scheme.warning_foreground = Fore.MAGENTA
+        result = formatter.format(record)
+        self.assertIn(color_scheme.prefix_for("message") + "Colored message", result)
+        self.assertIn(Fore.MAGENTA + "WARNING", result)
+
     def test_format_json_pretty(self):
         """Test JSON pretty format."""
         from flashlogger.log_channel_abc import LogChannelABC
@@ -149,6 +258,18 @@ class ConsoleFormatterTests(unittest.TestCase):
         # Should be compact (single line)
         self.assertNotIn('\n', result)
 
+    def test_format_json_keyword_args_in_order(self):
+        """Test that keyword args stored on the record are written in the order they were passed."""
+        formatter = ConsoleFormatter(output_format=OutputFormat.JSON_LINES)
+        logger = logging.getLogger("test.json_keyword_args")
+        record = logger.makeRecord("test", logging.INFO, "", 0, "Test message", (), None,
+                                   extra={"user_id": 123, "file": "f.py", "action": "login"})
+
+        parsed = json.loads(formatter.format(record))
+        self.assertEqual([key for key in parsed if key in ("user_id", "action", "taskName", "funcName")],
+                         ["user_id", "action"])
+        self.assertEqual(parsed["file"], "f.py")
+
     def test_format_human_readable_default(self):
         """Test default format is human readable."""
         formatter = ConsoleFormatter()
@@ -169,8 +290,7 @@ class LogChannelConsoleTests(unittest.TestCase):
     def setUp(self):
         """Reset any static/global state."""
         # Ensure we start with clean static flags
-        if hasattr(LogChannelConsole, '_handler_added'):
-            delattr(LogChannelConsole, '_handler_added')
+        LogChannelConsole._handler_added = False
 
     @patch('flashlogger.log_channel_console.LogChannelConsole.get_shared_logger')
     def test_init_use_shared_logger(self, mock_get_logger):
@@ -213,12 +333,24 @@ class LogChannelConsoleTests(unittest.TestCase):
 
     @patch('flashlogger.log_channel_console.ColorScheme')
     def test_default_color_scheme_creation(self, mock_color_scheme_class):
-        """Test that a ColorScheme is created if none provided."""
-        mock_color_scheme_class.return_value = MagicMock()
-
+        """Test that a copy of the shared ColorScheme is used if none provided."""
         channel = LogChannelConsole()
 
-        mock_color_scheme_class.assert_called_once()
+        mock_color_scheme_class.shared.assert_called_once_with(default_scheme=None)
+        self.assertIs(channel.color_scheme, mock_color_scheme_class.shared.return_value.copy.return_value)
+
+    def test_color_scheme_copied_from_shared_instance(self):
+        """Test that channels copy the shared color scheme instead of loading it, and keep changes private."""
+        from colorama import Fore
+        shared = ColorScheme.shared(default_scheme=ColorScheme.Default.BLACK_AND_WHITE)
+        with patch.object(ColorScheme, "_load_from_config") as load_from_config:
+            channel = LogChannelConsole(color_scheme=ColorScheme.Default.BLACK_AND_WHITE)
+        load_from_config.assert_not_called()
+        self.assertIsNot(channel.color_scheme, shared)
+        self.assertEqual(channel.color_scheme.get("info"), shared.get("info"))
+
+        channel.color_scheme.set_colors("info", foreground=Fore.MAGENTA)
+        self.assertNotEqual(shared.info_foreground, Fore.MAGENTA)
 
     def test_level_filtering_inherited(self):
         """Test that log level filtering is inherited from ABC."""
@@ -256,6 +388,19 @@ class LogChannelConsoleTests(unittest.TestCase):
         channel.do_log(LogLevel.WARNING, "Warning message")
         mock_logger.log.assert_called_once()
 
+    @patch('flashlogger.log_channel_console.LogChannelConsole.get_shared_logger')
+    def test_do_log_skips_levels_disabled_on_logger(self, mock_get_logger):
+        """Test do_log does not build a record the underlying logger would drop."""
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        mock_get_logger.return_value = mock_logger
+
+        channel = LogChannelConsole()
+        channel.do_log(LogLevel.INFO, "Test message")
+
+        mock_logger.isEnabledFor.assert_called_once_with(LogLevel.INFO.logging_level())
+        mock_logger.log.assert_not_called()
+
     @patch('flashlogger.log_channel_console.LogChannelConsole.get_shared_logger')
     def test_do_log_with_string_level(self, mock_get_logger):
         """Test do_log accepts string level."""
@@ -303,6 +448,75 @@ class LogChannelConsoleTests(unittest.TestCase):
 
         self.assertEqual(channel.output_format, OutputFormat.HUMAN_READABLE)
 
+    def test_needs_call_site(self):
+        """Test that the call site is only needed when the output shows it."""
+        LogChannelConsole.reset_handlers()
+        try:
+            channel = LogChannelConsole()
+            self.assertTrue(channel.needs_call_site)
+
+            channel._formatter.field_order = ["timestamp", "level", "message"]
+            self.assertFalse(channel.needs_call_site)
+
+            channel.set_output_format(OutputFormat.JSON_LINES)
+            self.assertTrue(channel.needs_call_site)
+
+            # without a formatter the channel's own settings decide
+            channel._formatter = None
+            channel.output_format = OutputFormat.HUMAN_READABLE
+            channel.field_order = ["timestamp", "level", "message"]
+            self.assertFalse(channel.needs_call_site)
+        finally:
+            LogChannelConsole.reset_handlers()
+
+    def test_needs_call_site_follows_shared_formatter(self):
+        """Test that a channel rendering through the shared formatter reports the call site it shows."""
+        from flashlogger.flash_logger import FlashLogger
+
+        LogChannelConsole.reset_handlers()
+        try:
+            LogChannelConsole(color_scheme=ColorScheme.Default.PLAIN_TEXT)
+            channel = LogChannelConsole(color_scheme=ColorScheme.Default.PLAIN_TEXT)
+            channel.field_order = ["timestamp", "level", "message"]
+            handler = LogChannelConsole._shared_handler
+            handler.setStream(io.StringIO())
+
+            FlashLogger([channel]).log_warning("hello")
+
+            output = handler.stream.getvalue()
+            self.assertIn("hello", output)
+            self.assertIn(f"{Path(__file__).name}:", output)
+            self.assertNotIn("unknown", output)
+        finally:
+            LogChannelConsole.reset_handlers()
+
+    def test_shared_handler_installed_once_and_reset(self):
+        """Test that channels share one console handler until reset_handlers() removes it."""
+        channel = LogChannelConsole()
+        handler = LogChannelConsole._shared_handler
+        LogChannelConsole()
+        self.assertEqual(channel._logger.handlers.count(handler), 1)
+        self.assertEqual(sum(isinstance(h.formatter, ConsoleFormatter) for h in channel._logger.handlers), 1)
+
+        LogChannelConsole.reset_handlers()
+        self.assertNotIn(handler, channel._logger.handlers)
+        self.assertIsNone(LogChannelConsole._shared_handler)
+        LogChannelConsole()
+        self.assertIn(LogChannelConsole._shared_handler, channel._logger.handlers)
+        self.assertIsNot(LogChannelConsole._shared_handler, handler)
+
+    def test_setters_update_formatter_of_shared_handler(self):
+        """Test that the setters update the formatter of the shared console handler."""
+        channel = LogChannelConsole()
+        formatter = LogChannelConsole._shared_handler.formatter
+        self.assertIs(channel._formatter, formatter)
+
+        channel.set_output_format(OutputFormat.JSON_LINES)
+        self.assertEqual(formatter.output_format, OutputFormat.JSON_LINES)
+        channel.set_color_scheme(ColorScheme.Default.BLACK_AND_WHITE)
+        self.assertIs(formatter.color_scheme, channel.color_scheme)
+        channel.set_output_format(OutputFormat.HUMAN_READABLE)
+
     def test_set_color_scheme_with_enum(self):
         """Test set_color_scheme with ColorScheme.Default enum."""
         channel = LogChannelConsole()
@@ -506,5 +720,111 @@ class LogChannelConsoleTests(unittest.TestCase):
         self.assertEqual(channel1.output_format, OutputFormat.JSON_PRETTY)
         self.assertEqual(channel2.output_format, OutputFormat.JSON_PRETTY)
 
+
+class AsyncBatchHandlerTests(unittest.TestCase):
+
+    def test_flush_waits_for_records_of_all_threads(self):
+        """Test that the writer formats the records with the issuing thread and flush() waits for them."""
+        channel = LogChannelConsole(color_scheme=ColorScheme.Default.PLAIN_TEXT)
+        stream = io.StringIO()
+        handler = _AsyncBatchHandler(stream)
+        handler.setFormatter(ConsoleFormatter(color_scheme=ColorScheme.plain_text_singleton(), channel=channel))
+        thread_ids = []
+        # Keep all producers alive until each has emitted, so no thread ID is reused
+        all_emitted = threading.Barrier(3)
+
+        def emit_records():
+            thread_ids.append(threading.get_ident())
+            for i in range(200):
+                handler.emit(logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0,
+                                               msg="record %d", args=(i,), exc_info=None))
+            all_emitted.wait()
+
+        producers = [threading.Thread(target=emit_records) for _ in range(3)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        handler.close()
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 600)
+        self.assertEqual(sum("record 199" in line for line in lines), 3)
+        for thread_id in thread_ids:
+            self.assertEqual(sum(f"tid:{thread_id}" in line for line in lines), 200)
+
+    def test_close_stops_writer_thread(self):
+        """Test that close() writes the enqueued records and joins the writer thread."""
+        stream = io.StringIO()
+        handler = _AsyncBatchHandler(stream)
+        handler.setFormatter(ConsoleFormatter(color_scheme=ColorScheme.plain_text_singleton()))
+        handler.emit(logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0,
+                                       msg="last words", args=(), exc_info=None))
+        handler.close()
+
+        self.assertFalse(handler._writer.is_alive())
+        self.assertIn("last words", stream.getvalue())
+        handler.flush()
+        handler.close()
+
+    def test_emit_merges_message_arguments(self):
+        """Test that emit() renders human-readable messages, so later changes to the arguments are not written."""
+        stream = io.StringIO()
+        handler = _AsyncBatchHandler(stream)
+        handler.setFormatter(ConsoleFormatter(color_scheme=ColorScheme.plain_text_singleton()))
+        items = ["first"]
+        record = logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0,
+                                   msg="items %s", args=(items,), exc_info=None)
+        unformattable = logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0,
+                                          msg="no placeholder", args=("extra",), exc_info=None)
+        try:
+            handler.emit(record)
+            handler.emit(unformattable)
+            items.append("second")
+            handler.flush()
+        finally:
+            handler.close()
+
+        self.assertIn("items ['first']", stream.getvalue())
+        self.assertIn("no placeholder", stream.getvalue())
+        # The record passed to other handlers keeps its arguments
+        self.assertEqual(record.msg, "items %s")
+        self.assertEqual(record.args, (items,))
+
+    def test_emit_keeps_arguments_for_json(self):
+        """Test that emit() keeps message and arguments apart for JSON output."""
+        stream = io.StringIO()
+        handler = _AsyncBatchHandler(stream)
+        handler.setFormatter(ConsoleFormatter(color_scheme=ColorScheme.plain_text_singleton(),
+                                              output_format=OutputFormat.JSON_LINES))
+        try:
+            handler.emit(logging.LogRecord(name="test", level=logging.INFO, pathname="", lineno=0,
+                                           msg={"event": "copied"}, args=("file.txt",), exc_info=None))
+        finally:
+            handler.close()
+
+        entry = json.loads(stream.getvalue())
+        self.assertEqual(entry["event"], "copied")
+        self.assertEqual(entry["message0"], "file.txt")
+
+    def test_asynchronous_channel_installs_batch_handler(self):
+        """Test that an asynchronous channel writes through the batch handler and flush() waits for it."""
+        logger = logging.getLogger("test.asynchronous_console")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        with patch.object(LogChannelConsole, "get_shared_logger", return_value=logger):
+            channel = LogChannelConsole(color_scheme=ColorScheme.Default.PLAIN_TEXT, asynchronous=True)
+        handler = logger.handlers[0]
+        try:
+            self.assertIsInstance(handler, _AsyncBatchHandler)
+            handler.setStream(io.StringIO())
+            channel.do_log(LogLevel.INFO, "asynchronous entry")
+            channel.flush()
+            self.assertIn("asynchronous entry", handler.stream.getvalue())
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+
 if __name__ == '__main__':
     unittest.main()
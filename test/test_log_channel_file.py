@@ -212,6 +212,21 @@ class FileLogChannelTests(unittest.TestCase):
             # But the exact format depends on the logging system
             self.assertIsInstance(content, str)  # At least readable
 
+    def test_buffered_channel_writes_on_flush_and_errors(self):
+        """Test that a buffered channel holds entries back until flush() or an error."""
+        channel = FileLogChannel(self.log_file, buffer_size=64 * 1024)
+
+        channel.do_log(LogLevel.WARNING, "buffered warning")
+        self.assertNotIn("buffered warning", self.log_file.read_text(encoding="utf-8"))
+
+        channel.flush()
+        self.assertIn("buffered warning", self.log_file.read_text(encoding="utf-8"))
+
+        channel.do_log(LogLevel.ERROR, "immediate error")
+        self.assertIn("immediate error", self.log_file.read_text(encoding="utf-8"))
+        logging.getLogger().removeHandler(channel._file_handler)
+        channel._file_handler.close()
+
     def test_shared_logger_configuration(self):
         """Test that file logging uses shared logger infrastructure."""
         # The FileLogChannel sets up basicConfig, so this tests that it works
@@ -239,6 +254,19 @@ class FileLogChannelTests(unittest.TestCase):
         # Clean up
         unique_file.unlink()
 
+    def test_set_output_format_updates_formatter(self):
+        """Test that changing the output format after construction affects the written entries."""
+        from flashlogger.log_channel_abc import OutputFormat
+        channel = FileLogChannel(self.log_file)
+        channel.set_output_format("json_lines")
+
+        self.assertEqual(channel._file_handler.formatter.output_format, OutputFormat.JSON_LINES)
+        channel.do_log(LogLevel.WARNING, "json entry")
+        channel.flush()
+        self.assertIn('"message": "json entry"', self.log_file.read_text(encoding="utf-8"))
+        logging.getLogger().removeHandler(channel._file_handler)
+        channel._file_handler.close()
+
 
 if __name__ == '__main__':
     unittest.main()
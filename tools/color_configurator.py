@@ -76,6 +76,12 @@ except ImportError:
 
 init(autoreset=False)
 
+# ANSI code -> color name for each colorama module; reversed so the first name in dir() order wins
+_ANSI_TO_NAME = {
+    module: {getattr(module, name): name for name in reversed(dir(module)) if not name.startswith('_')}
+    for module in (Fore, Back)
+}
+
 
 class ColorConfigurator:
     """Interactive tool for simplified configuring of colors."""
@@ -561,11 +567,10 @@ class ColorConfigurator:
         bg_set = False
         if fg_part is not None and fg_part.lower() != "_":
             if fg_part.lower() == "null":
-                setattr(self.color_scheme, f"{level_name}_foreground", None)
+                self.color_scheme.set_colors(level_name, foreground=None)
                 fg_set = True
             elif fg_part.upper() in [c.upper() for c in COLOR_STRINGS]:
-                setattr(self.color_scheme, f"{level_name}_foreground",
-                        getattr(Fore, fg_part.upper()))
+                self.color_scheme.set_colors(level_name, foreground=getattr(Fore, fg_part.upper()))
                 fg_set = True
             else:
                 print(f"❌ Invalid foreground color: {fg_part}")
@@ -574,11 +579,10 @@ class ColorConfigurator:
         # Process background
         if bg_part is not None and bg_part.lower() != "_":
             if bg_part.lower() == "null":
-                setattr(self.color_scheme, f"{level_name}_background", None)
+                self.color_scheme.set_colors(level_name, background=None)
                 bg_set = True
             elif bg_part.upper() in [c.upper() for c in COLOR_STRINGS]:
-                setattr(self.color_scheme, f"{level_name}_background",
-                        getattr(Back, bg_part.upper()))
+                self.color_scheme.set_colors(level_name, background=getattr(Back, bg_part.upper()))
                 bg_set = True
             else:
                 print(f"❌ Invalid background color: {bg_part}")
@@ -594,8 +598,7 @@ class ColorConfigurator:
                 bg_inv = None
             else:
                 bg_inv = getattr(Back, fg_part.upper())
-            setattr(self.color_scheme, f"{level_name}_foreground_inverse", fg_inv)
-            setattr(self.color_scheme, f"{level_name}_background_inverse", bg_inv)
+            self.color_scheme.set_colors(level_name, foreground_inverse=fg_inv, background_inverse=bg_inv)
 
         # Display the updated line
         self._display_level_line(level_name)
@@ -758,22 +761,7 @@ class ColorConfigurator:
 
     def save_colors_to_file(self, file_path):
         """Save the current color scheme to a JSON file."""
-        config_data = {}
-        for level in self.color_scheme.all_levels:
-            fg = getattr(self.color_scheme, f"{level}_foreground", "")
-            bg = getattr(self.color_scheme, f"{level}_background", "")
-
-            # Convert ANSI codes back to color names
-            fg_name = self._ansi_to_name(fg, Fore)
-            bg_name = self._ansi_to_name(bg, Back)
-
-            config_data[level] = {
-                "foreground": fg_name,
-                "background": bg_name
-            }
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2, default=str)
+        self.color_scheme.save_to_json(file_path)
 
     @staticmethod
     def save_labels_to_file(file_path):
@@ -903,19 +891,8 @@ class ColorConfigurator:
             if overwrite != "y":
                 return
         # Save current config as new
-        config_data = {}
         if schema_type == "color":
-            for level in self.color_scheme.all_levels:
-                fg = getattr(self.color_scheme, f"{level}_foreground", "")
-                bg = getattr(self.color_scheme, f"{level}_background", "")
-                fg_name = self._ansi_to_name(fg, Fore)
-                bg_name = self._ansi_to_name(bg, Back)
-                config_data[level] = {
-                    "foreground": fg_name,
-                    "background": bg_name
-                }
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, indent=2, default=str)
+            self.color_scheme.save_to_json(file_path)
             # Load the newly created scheme to make it active (updates symlink)
             self.color_scheme = ColorScheme(colorscheme_json=file_path, update_active_link=True)
             print(f"✅ New display scheme '{name}' saved and activated.")
@@ -1019,12 +996,7 @@ class ColorConfigurator:
         if not ansi_code:
             return None
 
-        for attr_name in dir(module):
-            attr_value = getattr(module, attr_name, None)
-            if attr_value == ansi_code:
-                return attr_name
-
-        return None
+        return _ANSI_TO_NAME[module].get(ansi_code)
 
     def _get_sorted_level_info(self):
         """Get the sorted level information for consistent use."""